@@ -0,0 +1,94 @@
+"""Scaling of resource plan lookups: linear scan vs. IntervalIndex.
+
+Run from the repository root (needs Home Assistant installed, like the integration):
+
+    python -m benchmarks.bench_interval_index
+"""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+import random
+import timeit
+
+from custom_components.easyjob_timecard.timeline import IntervalIndex, ResourcePlanItem
+
+SIZES = (100, 1_000, 5_000, 20_000)
+WINDOW_DAYS = 365
+
+
+def make_items(n: int, seed: int = 0) -> list[ResourcePlanItem]:
+    rnd = random.Random(seed)
+    origin = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    items = []
+    for i in range(n):
+        start = origin + timedelta(minutes=rnd.randrange(WINDOW_DAYS * 24 * 60))
+        end = start + timedelta(minutes=rnd.randrange(15, 3 * 24 * 60))
+        items.append(
+            ResourcePlanItem(
+                id=i,
+                id_t=rnd.randrange(10),
+                caption=f"Item {i}",
+                caption_norm=f"item {i}",
+                color=None,
+                start=start,
+                end=end,
+            )
+        )
+    return items
+
+
+# ---- Linear baselines (what calendar / adaptive polling did before the index) ----
+
+def linear_range(items, start, end):
+    return sorted((it for it in items if it.end >= start and it.start <= end), key=lambda it: it.start)
+
+
+def linear_current_or_next(items, now):
+    return min((it for it in items if it.end > now), key=lambda it: it.start, default=None)
+
+
+def linear_boundary(items, now, window):
+    near, nxt = False, None
+    for it in items:
+        for b in (it.start, it.end):
+            if abs(b - now) <= window:
+                near = True
+            if b > now and (nxt is None or b < nxt):
+                nxt = b
+    return near, nxt
+
+
+def main() -> None:
+    window = timedelta(minutes=10)
+    print(f"{'n':>7} {'query':<18} {'linear µs':>11} {'index µs':>10} {'speedup':>8}")
+    for n in SIZES:
+        items = make_items(n)
+        index = IntervalIndex(items)
+        now = datetime(2026, 7, 1, 12, tzinfo=timezone.utc)
+        week = (now, now + timedelta(days=7))
+        build = timeit.timeit(lambda: IntervalIndex(items), number=5) / 5 * 1e6
+
+        cases = {
+            "range (1 week)": (
+                lambda: linear_range(items, *week),
+                lambda: index.overlapping(*week),
+            ),
+            "current/next": (
+                lambda: linear_current_or_next(items, now),
+                lambda: next(index.iter_not_ended(now), None),
+            ),
+            "poll boundaries": (
+                lambda: linear_boundary(items, now, window),
+                lambda: (index.has_boundary_within(now, window), index.next_boundary(now)),
+            ),
+        }
+        for name, (linear, indexed) in cases.items():
+            number = max(10, 20_000 // n)
+            t_lin = timeit.timeit(linear, number=number) / number * 1e6
+            t_idx = timeit.timeit(indexed, number=number) / number * 1e6
+            print(f"{n:>7} {name:<18} {t_lin:>11.1f} {t_idx:>10.1f} {t_lin / t_idx:>7.0f}x")
+        print(f"{n:>7} {'(index build)':<18} {'':>11} {build:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""util.parse_datetime: generic HA path vs. fast path, uncached and cached.
+
+Run from the repository root (needs Home Assistant installed, like the integration):
+
+    python -m benchmarks.bench_parse_datetime
+"""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import timeit
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.easyjob_timecard import util
+
+# Typical resource plan values: naive, with fraction, with offset
+SAMPLES = [
+    (datetime(2026, 1, 1, 8) + timedelta(minutes=15 * i)).isoformat(timespec="seconds") + suffix
+    for i in range(500)
+    for suffix in ("", ".000", "+01:00")
+]
+
+
+def generic(value: str) -> datetime | None:
+    """parse_datetime before the fast path (HA's regex parser + as_utc)."""
+    dt = dt_util.parse_datetime(value)
+    return None if dt is None else dt_util.as_utc(dt)
+
+
+def fast_uncached(value: str) -> datetime | None:
+    return util._parse_datetime_str.__wrapped__(value, dt_util.DEFAULT_TIME_ZONE)
+
+
+def run(func, number: int = 20) -> float:
+    """µs per call over all samples."""
+    total = timeit.timeit(lambda: [func(v) for v in SAMPLES], number=number)
+    return total / (number * len(SAMPLES)) * 1e6
+
+
+def main() -> None:
+    dt_util.set_default_time_zone(dt_util.get_time_zone("Europe/Berlin"))
+    util._parse_datetime_str.cache_clear()
+    util.parse_datetime(SAMPLES[0])  # warm up
+
+    baseline = run(generic)
+    print(f"{len(SAMPLES)} distinct timestamps, µs per call")
+    print(f"{'generic (before)':<24} {baseline:>7.2f}")
+    for name, func in (
+        ("fast path, uncached", fast_uncached),
+        ("parse_datetime (cached)", util.parse_datetime),
+    ):
+        t = run(func)
+        print(f"{name:<24} {t:>7.2f}   {baseline / t:>5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
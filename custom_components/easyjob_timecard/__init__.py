@@ -2,25 +2,57 @@
 
 import logging
 
+import aiohttp
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE, async_get_clientsession
+from homeassistant.helpers.storage import Store
 
 from .api import EasyjobClient
+from .circuit_breaker import CircuitBreaker
 from .const import (
     CONF_API_VERSION,
     CONF_BASE_URL,
+    CONF_CONNECT_TIMEOUT,
+    CONF_CONNECTION_LIMIT,
+    CONF_DEDICATED_CONNECTION,
+    CONF_DNS_CACHE_TTL,
+    CONF_JSON_OFFLOAD_KB,
+    CONF_KEEPALIVE_TIMEOUT,
+    CONF_LOOKAHEAD_DAYS,
+    CONF_LOOKBEHIND_DAYS,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
     CONF_PASSWORD,
+    CONF_READ_TIMEOUT,
     CONF_USERNAME,
     CONF_VERIFY_SSL,
     DEFAULT_API_VERSION,
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_CONNECTION_LIMIT,
+    DEFAULT_DEDICATED_CONNECTION,
+    DEFAULT_DNS_CACHE_TTL,
+    DEFAULT_JSON_OFFLOAD_KB,
+    DEFAULT_KEEPALIVE_TIMEOUT,
+    DEFAULT_LOOKAHEAD_DAYS,
+    DEFAULT_LOOKBEHIND_DAYS,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_READ_TIMEOUT,
     DOMAIN,
     PLATFORMS,
+    SCHEDULER_BURST,
+    SCHEDULER_MAX_CONCURRENCY,
+    SCHEDULER_RATE_PER_SECOND,
+    TOKEN_STORAGE_VERSION,
 )
-from .coordinator import EasyjobCoordinator
-from .runtime import RuntimeData
+from .coordinator import EasyjobCalendarCoordinator, EasyjobCoordinator
+from .runtime import HostSession, RuntimeData
+from .scheduler import RequestScheduler
 from .services import async_register_services
 
 _LOGGER = logging.getLogger(__name__)
@@ -33,6 +65,86 @@ def _make_stable_unique_id(base_url: str, username: str) -> str:
     return f"{base}|{user}"
 
 
+def _host_key(base_url: str) -> str:
+    """Key for resources shared by all entries pointing at the same easyjob server."""
+    return (base_url or "").strip().rstrip("/").lower()
+
+
+def _async_get_session(
+    hass: HomeAssistant, entry: ConfigEntry, domain_data: dict
+) -> aiohttp.ClientSession:
+    """Return the HTTP session for this entry.
+
+    Default: Home Assistant's shared session. With the "dedicated connection" option, all entries
+    of one easyjob server share an own TCPConnector (pool size, keep-alive, DNS cache). The
+    connector settings are taken from the entry that creates it.
+    """
+    if not entry.options.get(CONF_DEDICATED_CONNECTION, DEFAULT_DEDICATED_CONNECTION):
+        return async_get_clientsession(hass)
+
+    sessions: dict[str, HostSession] = domain_data.setdefault("sessions", {})
+    host_key = _host_key(entry.data[CONF_BASE_URL])
+    host = sessions.get(host_key)
+
+    if host is None or host.session.closed:
+        if host is not None and host.unsub_close is not None:
+            host.unsub_close()
+        connector = aiohttp.TCPConnector(
+            limit=int(entry.options.get(CONF_CONNECTION_LIMIT, DEFAULT_CONNECTION_LIMIT)),
+            keepalive_timeout=float(
+                entry.options.get(CONF_KEEPALIVE_TIMEOUT, DEFAULT_KEEPALIVE_TIMEOUT)
+            ),
+            use_dns_cache=True,
+            ttl_dns_cache=int(entry.options.get(CONF_DNS_CACHE_TTL, DEFAULT_DNS_CACHE_TTL)),
+        )
+        session = aiohttp.ClientSession(
+            connector=connector,
+            headers={aiohttp.hdrs.USER_AGENT: SERVER_SOFTWARE},
+        )
+        host = sessions[host_key] = HostSession(session=session)
+
+        async def _async_close_session(_event: Event) -> None:
+            # Fired once -> already removed from the bus
+            host.unsub_close = None
+            await host.session.close()
+
+        host.unsub_close = hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_CLOSE, _async_close_session
+        )
+
+    host.entry_ids.add(entry.entry_id)
+    return host.session
+
+
+async def _async_release_session(domain_data: dict, entry: ConfigEntry) -> None:
+    """Close the dedicated session of a server once its last entry is gone."""
+    sessions: dict[str, HostSession] = domain_data.get("sessions", {})
+    for host_key, host in list(sessions.items()):
+        if entry.entry_id not in host.entry_ids:
+            continue
+        host.entry_ids.discard(entry.entry_id)
+        if not host.entry_ids:
+            sessions.pop(host_key, None)
+            if host.unsub_close is not None:
+                host.unsub_close()
+                host.unsub_close = None
+            await host.session.close()
+
+
+def _token_store(hass: HomeAssistant, entry: ConfigEntry) -> Store:
+    """Private (0600) store holding the bearer token of one config entry.
+
+    Same protection as the config entry that holds the password; the token is bound to
+    server + account by a fingerprint so it is never reused for another login.
+    """
+    return Store(
+        hass,
+        TOKEN_STORAGE_VERSION,
+        f"{DOMAIN}.token.{entry.entry_id}",
+        private=True,
+    )
+
+
 async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Migrate config entry from entry_id-based identifiers/unique_ids to stable unique_id.
 
@@ -107,7 +219,22 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         new_uid = _make_stable_unique_id(entry.data[CONF_BASE_URL], entry.data[CONF_USERNAME])
         hass.config_entries.async_update_entry(entry, unique_id=new_uid)
 
-    session = async_get_clientsession(hass)
+    domain_data = hass.data.setdefault(DOMAIN, {"entries": {}, "services": {}})
+
+    # One circuit breaker per easyjob server: when it is down, all accounts fail fast together
+    circuit_breaker = domain_data.setdefault("circuit_breakers", {}).setdefault(
+        _host_key(entry.data[CONF_BASE_URL]), CircuitBreaker()
+    )
+
+    # All clients route through one scheduler: rate + concurrency budget per easyjob host
+    if "scheduler" not in domain_data:
+        domain_data["scheduler"] = RequestScheduler(
+            rate=SCHEDULER_RATE_PER_SECOND,
+            burst=SCHEDULER_BURST,
+            max_concurrency=SCHEDULER_MAX_CONCURRENCY,
+        )
+
+    session = _async_get_session(hass, entry, domain_data)
 
     api_version = entry.data.get(CONF_API_VERSION, DEFAULT_API_VERSION)
     client = EasyjobClient(
@@ -117,13 +244,48 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         password=entry.data[CONF_PASSWORD],
         verify_ssl=entry.data.get(CONF_VERIFY_SSL, True),
         api_version=api_version,
+        proactive_token_renewal=True,
+        token_store=_token_store(hass, entry),
+        circuit_breaker=circuit_breaker,
+        scheduler=domain_data["scheduler"],
+        connect_timeout=float(entry.options.get(CONF_CONNECT_TIMEOUT, DEFAULT_CONNECT_TIMEOUT)),
+        read_timeout=float(entry.options.get(CONF_READ_TIMEOUT, DEFAULT_READ_TIMEOUT)),
+        json_offload_bytes=int(entry.options.get(CONF_JSON_OFFLOAD_KB, DEFAULT_JSON_OFFLOAD_KB)) * 1024,
     )
+    # Reuse a still valid token from before the restart instead of logging in again
+    await client.async_restore_token()
 
-    coordinator = EasyjobCoordinator(hass, client, entry)
-    await coordinator.async_config_entry_first_refresh()
+    calendar_coordinator = EasyjobCalendarCoordinator(
+        hass,
+        client,
+        entry,
+        lookbehind_days=int(entry.options.get(CONF_LOOKBEHIND_DAYS, DEFAULT_LOOKBEHIND_DAYS)),
+        lookahead_days=int(entry.options.get(CONF_LOOKAHEAD_DAYS, DEFAULT_LOOKAHEAD_DAYS)),
+        retry_interval=int(entry.options.get(CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL)),
+    )
+    coordinator = EasyjobCoordinator(
+        hass,
+        client,
+        entry,
+        calendar_coordinator=calendar_coordinator,
+        min_interval=int(entry.options.get(CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL)),
+        max_interval=int(entry.options.get(CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL)),
+    )
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        await client.async_shutdown()
+        await _async_release_session(domain_data, entry)
+        raise
 
-    domain_data = hass.data.setdefault(DOMAIN, {"entries": {}, "services": {}})
-    domain_data["entries"][entry.entry_id] = RuntimeData(client=client, coordinator=coordinator)
+    # Calendar failures are non-fatal -> plain refresh, setup does not depend on it
+    await calendar_coordinator.async_refresh()
+
+    domain_data["entries"][entry.entry_id] = RuntimeData(
+        client=client,
+        coordinator=coordinator,
+        calendar_coordinator=calendar_coordinator,
+    )
 
     # Reload entry when options change (important for dynamic entities / filters)
     entry.async_on_unload(entry.add_update_listener(_async_update_listener))
@@ -139,10 +301,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok and DOMAIN in hass.data:
-        hass.data[DOMAIN].get("entries", {}).pop(entry.entry_id, None)
+        runtime: RuntimeData | None = hass.data[DOMAIN].get("entries", {}).pop(entry.entry_id, None)
+        if runtime is not None:
+            await runtime.client.async_shutdown()
+        await _async_release_session(hass.data[DOMAIN], entry)
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Drop the persisted token when the config entry is deleted."""
+    await _token_store(hass, entry).async_remove()
+
+
 async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update by reloading the config entry."""
     await hass.config_entries.async_reload(entry.entry_id)
@@ -1,14 +1,36 @@
 ﻿from __future__ import annotations
 
+import asyncio
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
+import hashlib
+import json
+import logging
+import time
 from datetime import datetime, timedelta, timezone, date
-from typing import Any, Final
+from typing import Any, AsyncIterator, Awaitable, Callable, Final, Iterator, Mapping
 
 import aiohttp
 
+try:  # ships with Home Assistant; plain json is the fallback
+    import orjson
+except ImportError:
+    orjson = None
 
-from .const import DEFAULT_FILTERED_IDT
 
+from .circuit_breaker import STATE_HALF_OPEN, CircuitBreaker
+from .const import DEFAULT_CACHE_TTLS, DEFAULT_FILTERED_IDT
+from .retry import RetryBudget, RetryPolicy
+from .scheduler import RequestScheduler
+from .stream_decode import CalendarDecodeStats, decode_calendar
+
+_LOGGER = logging.getLogger(__name__)
+
+# Retry budget of the coordinator cycle the current task belongs to (see EasyjobClient.retry_cycle)
+_CYCLE_RETRY_BUDGET: ContextVar[RetryBudget | None] = ContextVar(
+    "easyjob_cycle_retry_budget", default=None
+)
 
 # ---- Exceptions ----
 
@@ -28,16 +50,101 @@ class EasyjobRequestError(EasyjobApiError):
     """Raised for non-auth request failures (HTTP/Network/Parse)."""
 
 
+class EasyjobCircuitOpenError(EasyjobRequestError):
+    """Raised without contacting the server while its circuit breaker is open."""
+
+
 # ---- Models ----
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class EasyjobWorkTime:
+    """Currently running work time, parsed once in the API layer.
+
+    `attributes` keeps every field except ID (in API order) for the work_time sensor.
+    """
+
+    id: int | None
+    start: Any = None
+    attributes: tuple[tuple[str, Any], ...] = ()
+
+    @classmethod
+    def from_api(cls, value: Any) -> EasyjobWorkTime | None:
+        """From CurrentWorkTime (dict, or a JSON string). None -> no work time running."""
+        if value is None:
+            return None
+        if isinstance(value, str):
+            try:
+                value = json.loads(value)
+            except ValueError:
+                value = None
+        if not isinstance(value, Mapping):
+            # Running, but without details we understand
+            return cls(id=None)
+
+        work_id = value.get("ID")
+        return cls(
+            id=int(work_id) if isinstance(work_id, (int, float)) else None,
+            start=next(
+                (value[key] for key in ("Start", "StartTime", "StartDate") if key in value),
+                None,
+            ),
+            attributes=tuple((k, v) for k, v in value.items() if k != "ID"),
+        )
+
+
+@dataclass(frozen=True)
 class EasyjobData:
+    """Timecard details snapshot. Immutable + value equality: equal payload == equal data."""
+
     date: str | None
     holidays: int | None
     total_work_minutes: int | None
     work_minutes: int | None
     work_minutes_planed: int | None
-    work_time: str | None  # derived from CurrentWorkTime
+    work_time: EasyjobWorkTime | None  # derived from CurrentWorkTime
+
+
+@dataclass
+class EasyjobClientMetrics:
+    """Per-client counters (exposed via diagnostics)."""
+
+    token_logins: int = 0
+    token_restored: int = 0
+    # Requests that had to wait for a /token round trip (renewal did not happen in time)
+    token_waits: int = 0
+    token_renewals: int = 0
+    token_renewal_failures: int = 0
+    # GETs that joined an identical request already in flight instead of hitting the server
+    coalesced_requests: int = 0
+    # Response cache: served without a request (TTL fresh) / revalidated via 304
+    cache_hits: int = 0
+    cache_revalidated: int = 0
+    retries: int = 0
+    # Retryable failures that were raised because the per-cycle retry budget was used up
+    retry_budget_exhausted: int = 0
+    # Requests failed fast because the server's circuit breaker was open
+    circuit_rejections: int = 0
+    # JSON decoding (large bodies are decoded in an executor, the calendar is streamed)
+    json_decodes: int = 0
+    json_decodes_offloaded: int = 0
+    json_decode_seconds_total: float = 0.0
+    json_decode_seconds_max: float = 0.0
+    json_bytes_max: int = 0
+    # Streamed calendar decoding: items kept / dropped by the IdT denylist
+    calendar_items_kept: int = 0
+    calendar_items_dropped: int = 0
+
+
+# Custom body decoder for a request (e.g. the streaming calendar decoder)
+ResponseDecoder = Callable[[aiohttp.ClientResponse], Awaitable[Any]]
+
+
+@dataclass
+class _CacheEntry:
+    payload: Any
+    fetched_at: float  # time.monotonic()
+    etag: str | None = None
+    last_modified: str | None = None
 
 
 # ---- Client ----
@@ -45,7 +152,15 @@ class EasyjobData:
 class EasyjobClient:
 
     _TOKEN_SAFETY_BUFFER_SECONDS: Final[int] = 60
-    _DEFAULT_TIMEOUT_SECONDS: Final[int] = 20
+    # Background renewal fires this long before expiry (must be > safety buffer)
+    _TOKEN_RENEW_LEAD_SECONDS: Final[int] = 120
+    _TOKEN_RENEW_RETRY_SECONDS: Final[int] = 30
+    _TOKEN_PERSIST_DELAY_SECONDS: Final[int] = 60
+    _DEFAULT_CONNECT_TIMEOUT_SECONDS: Final[int] = 10
+    _DEFAULT_READ_TIMEOUT_SECONDS: Final[int] = 20
+    # Room for all calendar chunks of a long window plus the settings endpoints
+    _CACHE_MAX_ENTRIES: Final[int] = 64
+    _DEFAULT_JSON_OFFLOAD_BYTES: Final[int] = 256 * 1024
 
     def __init__(
         self,
@@ -54,22 +169,70 @@ class EasyjobClient:
         username: str,
         password: str,
         verify_ssl: bool = True,
-        timeout: int = _DEFAULT_TIMEOUT_SECONDS,
+        connect_timeout: float = _DEFAULT_CONNECT_TIMEOUT_SECONDS,
+        read_timeout: float = _DEFAULT_READ_TIMEOUT_SECONDS,
         api_version: str = "v1",
+        proactive_token_renewal: bool = False,
+        token_store: Any | None = None,
+        cache_ttls: Mapping[str, float] | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        scheduler: RequestScheduler | None = None,
+        json_offload_bytes: int | None = _DEFAULT_JSON_OFFLOAD_BYTES,
     ) -> None:
         self._session = session
         self._base_url = base_url.rstrip("/")
         self._username = username
         self._password = password
         self._verify_ssl = verify_ssl
-        self._timeout = aiohttp.ClientTimeout(total=timeout)
+        # connect: pool wait + TCP/TLS connect; sock_read: max silence while reading the body
+        self._timeout = aiohttp.ClientTimeout(
+            total=None,
+            connect=connect_timeout,
+            sock_read=read_timeout,
+        )
         self.api_version = api_version
 
         self._access_token: str | None = None
         self._token_expires_at: datetime | None = None
+        # Single-flight: concurrent callers share one in-flight /token login.
+        self._token_task: asyncio.Task[str] | None = None
+
+        # Proactive renewal (only for long-lived clients, not for config flow validation)
+        self._proactive_token_renewal = proactive_token_renewal
+        self._renew_handle: asyncio.TimerHandle | None = None
+        self._renew_task: asyncio.Task[None] | None = None
+
+        # Optional persistence (HA Store: async_load/async_delay_save) to survive restarts
+        self._token_store = token_store
+
+        self.metrics = EasyjobClientMetrics()
 
         self._idaddress: int | None = None
 
+        # GET response cache (path -> decoded payload + validators).
+        # cache_ttls: path prefix -> seconds a response may be reused without asking the server.
+        self._cache: dict[str, _CacheEntry] = {}
+        self._cache_ttls: dict[str, float] = dict(
+            DEFAULT_CACHE_TTLS if cache_ttls is None else cache_ttls
+        )
+
+        # Transient failures (429/5xx/network) are retried. Each coordinator brings its own budget
+        # per cycle (retry_cycle); requests outside of a cycle (services, flows) get one each.
+        self._retry_policy = retry_policy or RetryPolicy()
+
+        # Shared per base_url by the integration setup, so all accounts on one server trip together
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+
+        # Domain-wide rate/concurrency budget per host (None: unthrottled, e.g. config flow)
+        self._scheduler = scheduler
+
+        # JSON bodies at least this large are decoded in an executor (None/0: always inline)
+        self._json_offload_bytes = json_offload_bytes
+
+        # In-flight GETs keyed by (method, path, token) -> shared task
+        self._inflight: dict[tuple[str, str, str | None], asyncio.Task[Any]] = {}
+
     # ---------- Common helpers ----------
 
     def _common_headers(self) -> dict[str, str]:
@@ -90,12 +253,33 @@ class EasyjobClient:
         ctype = resp.headers.get("Content-Type", "")
         return ctype.lower().startswith("application/json")
 
-    @staticmethod
-    async def _read_response(resp: aiohttp.ClientResponse) -> Any:
+    async def _read_response(self, resp: aiohttp.ClientResponse) -> Any:
         if EasyjobClient._is_json_response(resp):
-            return await resp.json()
+            return await self._decode_json(await resp.read())
         return await resp.text()
 
+    async def _decode_json(self, raw: bytes) -> Any:
+        """Decode a JSON body (orjson if available); large bodies off the event loop."""
+        if not raw.strip():
+            return None  # same as aiohttp's resp.json() for an empty body
+
+        loads = orjson.loads if orjson is not None else json.loads
+        started = time.perf_counter()
+        if self._json_offload_bytes and len(raw) >= self._json_offload_bytes:
+            payload = await asyncio.get_running_loop().run_in_executor(None, loads, raw)
+            self.metrics.json_decodes_offloaded += 1
+        else:
+            payload = loads(raw)
+        self._record_json_decode(time.perf_counter() - started, len(raw))
+        return payload
+
+    def _record_json_decode(self, seconds: float, size: int) -> None:
+        metrics = self.metrics
+        metrics.json_decodes += 1
+        metrics.json_decode_seconds_total += seconds
+        metrics.json_decode_seconds_max = max(metrics.json_decode_seconds_max, seconds)
+        metrics.json_bytes_max = max(metrics.json_bytes_max, size)
+
     def _raise_ssl_as_auth(self, err: Exception, prefix: str) -> None:
         # SSL/Cert errors are effectively auth/connectivity errors in UI.
         raise EasyjobAuthError(f"{prefix}: {err}") from err
@@ -107,6 +291,8 @@ class EasyjobClient:
         *,
         auth: bool = True,
         headers: dict[str, str] | None = None,
+        decoder: ResponseDecoder | None = None,
+        decoder_variant: str | None = None,
         **kwargs: Any,
     ) -> Any:
         """Perform a request against base_url.
@@ -114,73 +300,367 @@ class EasyjobClient:
         - Adds required protonic header `ej-webapi-client: ThirdParty`
         - Adds Bearer token if auth=True
         - Retries once on 401 by forcing a new token
+        - Concurrent identical GETs share one network request
+        - GETs are served from cache while fresh, revalidated with ETag/Last-Modified otherwise
         - Normalizes errors into Easyjob* exceptions
+        - `decoder` replaces the default body decoding; its output depends on `decoder_variant`,
+          which is therefore part of the cache/coalescing key
         """
+        if _CYCLE_RETRY_BUDGET.get() is None:
+            # Not part of a coordinator cycle (service call, button, entity setup):
+            # a fresh budget, so earlier failures never use up the retries of later calls
+            with self.retry_cycle(RetryBudget()):
+                return await self._request(
+                    method,
+                    path,
+                    auth=auth,
+                    headers=headers,
+                    decoder=decoder,
+                    decoder_variant=decoder_variant,
+                    **kwargs,
+                )
+
+        is_plain_get = method.upper() == "GET" and not headers and not kwargs
+        cache_key = path if decoder_variant is None else f"{path}#{decoder_variant}"
+
+        if is_plain_get:
+            cached = self._cache_get_fresh(cache_key)
+            if cached is not None:
+                self.metrics.cache_hits += 1
+                return cached.payload
+
+        token: str | None = None
+        if auth:
+            token = await self.async_get_token()
+
+        if not is_plain_get:
+            result = await self._async_send(
+                method, path, token, headers=headers, decoder=decoder, **kwargs
+            )
+            # Writes (start/stop, resource states) may change anything we cached
+            if method.upper() != "GET":
+                self._cache.clear()
+            return result
+
+        key = ("GET", cache_key, token)
+        task = self._inflight.get(key)
+        if task is not None:
+            self.metrics.coalesced_requests += 1
+        else:
+            task = asyncio.ensure_future(
+                self._async_send(
+                    method,
+                    path,
+                    token,
+                    cached=self._cache.get(cache_key),
+                    cache_key=cache_key,
+                    decoder=decoder,
+                )
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._on_inflight_done(key, t))
+
+        # shield: one cancelled caller must not cancel the request for everyone else
+        return await asyncio.shield(task)
+
+    def _on_inflight_done(self, key: tuple[str, str, str | None], task: asyncio.Task[Any]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()
+
+    async def _async_send(
+        self,
+        method: str,
+        path: str,
+        token: str | None,
+        *,
+        headers: dict[str, str] | None = None,
+        cached: _CacheEntry | None = None,
+        cache_key: str | None = None,
+        decoder: ResponseDecoder | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Send a request (retrying transient failures per RetryPolicy) and decode the response."""
         url = f"{self._base_url}{path}"
+        cache_key = cache_key or path
+
+        if cached is not None:
+            # Conditional request: the server may answer 304 and skip the payload
+            conditional: dict[str, str] = {}
+            if cached.etag:
+                conditional["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                conditional["If-Modified-Since"] = cached.last_modified
+            headers = conditional | (headers or {})
+
+        attempt = 0
+        while True:
+            try:
+                async with self._circuit(), self._slot():
+                    return await self._async_exchange(
+                        method, url, cache_key, token, headers, cached, decoder, kwargs
+                    )
+            except aiohttp.ClientConnectorCertificateError as err:
+                self._raise_ssl_as_auth(err, "SSL certificate error")
+            except aiohttp.ClientSSLError as err:
+                self._raise_ssl_as_auth(err, "SSL error")
+            except aiohttp.ClientResponseError as err:
+                # HTTP error with status already in err.status
+                delay = self._retry_delay(
+                    method,
+                    attempt,
+                    status=err.status,
+                    retry_after=err.headers.get("Retry-After") if err.headers else None,
+                )
+                if delay is None:
+                    raise EasyjobRequestError(f"HTTP error {err.status}: {err.message}") from err
+                _LOGGER.debug(
+                    "%s %s failed with HTTP %s, retrying in %.1fs", method, path, err.status, delay
+                )
+            except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+                delay = self._retry_delay(
+                    method,
+                    attempt,
+                    # Connection never established -> the server cannot have processed it
+                    connect_error=isinstance(err, aiohttp.ClientConnectorError),
+                )
+                if delay is None:
+                    raise EasyjobRequestError(f"Network error: {err}") from err
+                _LOGGER.debug("%s %s failed (%r), retrying in %.1fs", method, path, err, delay)
+
+            self.metrics.retries += 1
+            await asyncio.sleep(delay)
+            attempt += 1
+            if token is not None:
+                token = await self.async_get_token()
+
+    async def _async_exchange(
+        self,
+        method: str,
+        url: str,
+        cache_key: str,
+        token: str | None,
+        headers: dict[str, str] | None,
+        cached: _CacheEntry | None,
+        decoder: ResponseDecoder | None,
+        kwargs: dict[str, Any],
+    ) -> Any:
+        """One HTTP exchange (plus a single 401 retry with a fresh token)."""
+        auth = token is not None
 
         base_headers = self._common_headers()
         if headers:
             base_headers.update(headers)
 
-        token: str | None = None
         if auth:
-            token = await self.async_get_token()
             base_headers = self._auth_headers(token) | (headers or {})
 
+        async with self._session.request(
+            method,
+            url,
+            headers=base_headers,
+            ssl=self._verify_ssl,
+            timeout=self._timeout,
+            **kwargs,
+        ) as resp:
+            self.circuit_breaker.record_success()
+            if auth and resp.status == 401:
+                # refresh token once and retry (shared with concurrent 401s)
+                token = await self.async_get_token(force=True, stale_token=token)
+                retry_headers = self._auth_headers(token) | (headers or {})
+                async with self._session.request(
+                    method,
+                    url,
+                    headers=retry_headers,
+                    ssl=self._verify_ssl,
+                    timeout=self._timeout,
+                    **kwargs,
+                ) as resp2:
+                    if resp2.status in (401, 403):
+                        raise EasyjobAuthError("Unauthorized (401/403).")
+                    return await self._async_finish(method, cache_key, resp2, cached, decoder)
+
+            if resp.status in (401, 403) and auth:
+                raise EasyjobAuthError("Unauthorized (401/403).")
+
+            # 429/5xx raise here and are retried by _async_send per RetryPolicy
+            return await self._async_finish(method, cache_key, resp, cached, decoder)
+
+    @contextmanager
+    def retry_cycle(self, budget: RetryBudget) -> Iterator[None]:
+        """Charge retries of all requests started inside this block to `budget`.
+
+        Context-local, so the details and calendar coordinators (sharing this client) each
+        spend only their own per-cycle budget, even while their cycles overlap.
+        """
+        reset_token = _CYCLE_RETRY_BUDGET.set(budget)
         try:
-            async with self._session.request(
-                method,
-                url,
-                headers=base_headers,
-                ssl=self._verify_ssl,
-                timeout=self._timeout,
-                **kwargs,
-            ) as resp:
-                if auth and resp.status == 401:
-                    # refresh token once and retry
-                    token = await self.async_get_token(force=True)
-                    retry_headers = self._auth_headers(token) | (headers or {})
-                    async with self._session.request(
-                        method,
-                        url,
-                        headers=retry_headers,
-                        ssl=self._verify_ssl,
-                        timeout=self._timeout,
-                        **kwargs,
-                    ) as resp2:
-                        if resp2.status in (401, 403):
-                            raise EasyjobAuthError("Unauthorized (401/403).")
-                        resp2.raise_for_status()
-                        return await self._read_response(resp2)
-
-                if resp.status in (401, 403) and auth:
-                    raise EasyjobAuthError("Unauthorized (401/403).")
-
-                # Optional: rate limiting could happen; treat as request error
-                # (you can add backoff later if needed)
-                resp.raise_for_status()
-                return await self._read_response(resp)
+            yield
+        finally:
+            _CYCLE_RETRY_BUDGET.reset(reset_token)
+
+    @asynccontextmanager
+    async def _circuit(self) -> AsyncIterator[None]:
+        """Fail fast while the server's circuit is open; feed connect failures into it."""
+        breaker = self.circuit_breaker
+        if not breaker.allow_request():
+            self.metrics.circuit_rejections += 1
+            raise EasyjobCircuitOpenError(
+                f"easyjob server unreachable, circuit open until {breaker.next_probe_at}"
+            )
+        probe = breaker.state == STATE_HALF_OPEN
+        try:
+            yield
+        except aiohttp.ClientSSLError:
+            # Certificate problems are not an outage; the server answered the handshake
+            raise
+        except (
+            aiohttp.ClientConnectorError,
+            aiohttp.ServerDisconnectedError,
+            aiohttp.ServerTimeoutError,
+            asyncio.TimeoutError,
+        ):
+            breaker.record_failure()
+            raise
+        finally:
+            if probe:
+                breaker.release_probe()
+
+    @asynccontextmanager
+    async def _slot(self, *, hold_concurrency: bool = True) -> AsyncIterator[None]:
+        """Wait for the shared request scheduler (if any) before talking to the server."""
+        if self._scheduler is None:
+            yield
+            return
+        async with self._scheduler.slot(
+            self._base_url.lower(), hold_concurrency=hold_concurrency
+        ):
+            yield
+
+    def _retry_delay(
+        self,
+        method: str,
+        attempt: int,
+        *,
+        status: int | None = None,
+        retry_after: str | None = None,
+        connect_error: bool = False,
+    ) -> float | None:
+        """Seconds to wait before retrying, or None if the failure must be raised."""
+        if not self._retry_policy.is_retryable(method, status=status, connect_error=connect_error):
+            return None
+        delay = self._retry_policy.delay(attempt, retry_after)
+        if delay is None:
+            return None
+        budget = _CYCLE_RETRY_BUDGET.get()
+        if budget is not None and not budget.try_consume():
+            self.metrics.retry_budget_exhausted += 1
+            return None
+        return delay
+
+    async def _async_finish(
+        self,
+        method: str,
+        cache_key: str,
+        resp: aiohttp.ClientResponse,
+        cached: _CacheEntry | None,
+        decoder: ResponseDecoder | None = None,
+    ) -> Any:
+        """Raise for HTTP errors, decode the body and feed the GET cache."""
+        if cached is not None and resp.status == 304:
+            cached.fetched_at = time.monotonic()
+            self.metrics.cache_revalidated += 1
+            return cached.payload
+
+        resp.raise_for_status()
+        payload = await (decoder or self._read_response)(resp)
+        if method.upper() == "GET":
+            self._cache_store(cache_key, resp, payload)
+        return payload
 
-        except aiohttp.ClientConnectorCertificateError as err:
-            self._raise_ssl_as_auth(err, "SSL certificate error")
-        except aiohttp.ClientSSLError as err:
-            self._raise_ssl_as_auth(err, "SSL error")
-        except aiohttp.ClientResponseError as err:
-            # HTTP error with status already in err.status
-            raise EasyjobRequestError(f"HTTP error {err.status}: {err.message}") from err
-        except aiohttp.ClientError as err:
-            raise EasyjobRequestError(f"Network error: {err}") from err
+    # ---------- Response cache ----------
+
+    def _cache_ttl(self, path: str) -> float:
+        for prefix, ttl in self._cache_ttls.items():
+            if path.startswith(prefix):
+                return float(ttl)
+        return 0.0
+
+    def _cache_get_fresh(self, path: str) -> _CacheEntry | None:
+        entry = self._cache.get(path)
+        if entry is None:
+            return None
+        ttl = self._cache_ttl(path)
+        if ttl <= 0 or time.monotonic() - entry.fetched_at >= ttl:
+            return None
+        return entry
+
+    def _cache_store(self, path: str, resp: aiohttp.ClientResponse, payload: Any) -> None:
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+        # Without validators a response is only worth keeping if its endpoint has a TTL
+        if not etag and not last_modified and self._cache_ttl(path) <= 0:
+            self._cache.pop(path, None)
+            return
+
+        self._cache[path] = _CacheEntry(
+            payload=payload,
+            fetched_at=time.monotonic(),
+            etag=etag,
+            last_modified=last_modified,
+        )
+        if len(self._cache) > self._CACHE_MAX_ENTRIES:
+            oldest = min(self._cache, key=lambda k: self._cache[k].fetched_at)
+            del self._cache[oldest]
 
     # ---------- Token ----------
 
-    async def async_get_token(self, force: bool = False) -> str:
-        """Get and cache Bearer token from /token (x-www-form-urlencoded)."""
-        if not force and self._access_token and self._token_expires_at:
-            if datetime.now(timezone.utc) < (
-                self._token_expires_at - timedelta(seconds=self._TOKEN_SAFETY_BUFFER_SECONDS)
-            ):
-                return self._access_token
+    def _token_is_valid(self) -> bool:
+        if not self._access_token or not self._token_expires_at:
+            return False
+        return datetime.now(timezone.utc) < (
+            self._token_expires_at - timedelta(seconds=self._TOKEN_SAFETY_BUFFER_SECONDS)
+        )
+
+    async def async_get_token(self, force: bool = False, stale_token: str | None = None) -> str:
+        """Get and cache Bearer token from /token (single-flight).
 
+        - Any number of concurrent callers share one in-flight login.
+        - `force=True` joins a login that is already running instead of starting another one.
+        - `stale_token` (the token that just got a 401): if another caller already replaced it,
+          the new token is returned without a further login.
+        """
+        if not force and self._token_is_valid():
+            return self._access_token  # type: ignore[return-value]
+
+        if (
+            force
+            and stale_token is not None
+            and self._access_token != stale_token
+            and self._token_is_valid()
+        ):
+            return self._access_token  # type: ignore[return-value]
+
+        self.metrics.token_waits += 1
+        # shield: a cancelled caller must not cancel the login the others are waiting for
+        return await asyncio.shield(self._ensure_login_task())
+
+    def _ensure_login_task(self) -> asyncio.Task[str]:
+        if self._token_task is None:
+            self._token_task = asyncio.ensure_future(self._async_login())
+            self._token_task.add_done_callback(self._on_token_task_done)
+        return self._token_task
+
+    def _on_token_task_done(self, task: asyncio.Task[str]) -> None:
+        if self._token_task is task:
+            self._token_task = None
+        # Mark the exception as retrieved even if every waiter was cancelled.
+        if not task.cancelled():
+            task.exception()
+
+    async def _async_login(self) -> str:
+        """POST /token (x-www-form-urlencoded) and cache the Bearer token."""
         form = {
             "grant_type": "password",
             "username": self._username,
@@ -192,13 +672,14 @@ class EasyjobClient:
         }
 
         try:
-            async with self._session.post(
+            async with self._circuit(), self._slot(hold_concurrency=False), self._session.post(
                 f"{self._base_url}/token",
                 data=form,
                 headers=headers,
                 ssl=self._verify_ssl,
                 timeout=self._timeout,
             ) as resp:
+                self.circuit_breaker.record_success()
                 if resp.status in (401, 403):
                     raise EasyjobAuthError("Token login failed (401/403).")
                 resp.raise_for_status()
@@ -220,8 +701,111 @@ class EasyjobClient:
         expires_in = int(payload.get("expires_in", 600))
         self._access_token = str(token)
         self._token_expires_at = datetime.now(timezone.utc) + timedelta(seconds=expires_in)
+        self.metrics.token_logins += 1
+        self._schedule_token_renewal(
+            max(expires_in / 2, expires_in - self._TOKEN_RENEW_LEAD_SECONDS)
+        )
+        self._persist_token()
         return self._access_token
 
+    # ---------- Token persistence ----------
+
+    def _token_fingerprint(self) -> str:
+        # Binds a stored token to server + account; no secrets in here.
+        raw = f"{self._base_url.lower()}|{self._username.strip().lower()}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _token_store_data(self) -> dict[str, Any]:
+        return {
+            "fingerprint": self._token_fingerprint(),
+            "token": self._access_token,
+            "expires_at": self._token_expires_at.isoformat() if self._token_expires_at else None,
+        }
+
+    def _persist_token(self) -> None:
+        if self._token_store is None or not self._access_token or not self._token_expires_at:
+            return
+        # Coalesced: one write per delay window instead of one per login; the store
+        # snapshots the current token when it actually writes (and on shutdown).
+        self._token_store.async_delay_save(
+            self._token_store_data, self._TOKEN_PERSIST_DELAY_SECONDS
+        )
+
+    async def async_restore_token(self) -> bool:
+        """Reuse a persisted token if it is still valid (avoids a login storm at startup).
+
+        If the server rejects it anyway, the first 401 falls back to a normal login.
+        """
+        if self._token_store is None:
+            return False
+        try:
+            data = await self._token_store.async_load()
+        except Exception as err:
+            _LOGGER.debug("Could not load persisted token: %s", err)
+            return False
+
+        if not isinstance(data, dict) or data.get("fingerprint") != self._token_fingerprint():
+            return False
+
+        token = data.get("token")
+        try:
+            expires_at = datetime.fromisoformat(str(data.get("expires_at")))
+        except ValueError:
+            return False
+        if not isinstance(token, str) or not token or expires_at.tzinfo is None:
+            return False
+
+        self._access_token = str(token)
+        self._token_expires_at = expires_at
+        if not self._token_is_valid():
+            self._access_token = None
+            self._token_expires_at = None
+            return False
+
+        self.metrics.token_restored += 1
+        remaining = (expires_at - datetime.now(timezone.utc)).total_seconds()
+        self._schedule_token_renewal(remaining - self._TOKEN_RENEW_LEAD_SECONDS)
+        return True
+
+    # ---------- Proactive token renewal ----------
+
+    def _schedule_token_renewal(self, delay: float) -> None:
+        """(Re)arm the renewal timer so requests never have to wait for /token."""
+        if not self._proactive_token_renewal:
+            return
+        if self._renew_handle is not None:
+            self._renew_handle.cancel()
+        self._renew_handle = asyncio.get_running_loop().call_later(
+            max(0.0, delay), self._on_renew_timer
+        )
+
+    def _on_renew_timer(self) -> None:
+        self._renew_handle = None
+        if self._renew_task is None or self._renew_task.done():
+            self._renew_task = asyncio.ensure_future(self._async_renew_token())
+
+    async def _async_renew_token(self) -> None:
+        try:
+            await asyncio.shield(self._ensure_login_task())
+        except EasyjobApiError as err:
+            self.metrics.token_renewal_failures += 1
+            _LOGGER.debug("Background token renewal failed: %s", err)
+            # Retry while the current token is still usable; afterwards requests log in lazily.
+            if self._token_is_valid():
+                self._schedule_token_renewal(self._TOKEN_RENEW_RETRY_SECONDS)
+            return
+        self.metrics.token_renewals += 1
+
+    async def async_shutdown(self) -> None:
+        """Stop background work (call on config entry unload)."""
+        self._proactive_token_renewal = False
+        if self._renew_handle is not None:
+            self._renew_handle.cancel()
+            self._renew_handle = None
+        if self._renew_task is not None and not self._renew_task.done():
+            self._renew_task.cancel()
+        self._renew_task = None
+
     # ---------- Public API ----------
 
     async def async_test_auth(self) -> None:
@@ -274,8 +858,7 @@ class EasyjobClient:
         path = f"/api.json/Timecard/Details?d={d}" if d else "/api.json/Timecard/Details?d"
         payload = await self._request("GET", path, auth=True)
 
-        current_work_time = payload.get("CurrentWorkTime")
-        work_time = None if current_work_time is None else str(current_work_time)
+        work_time = EasyjobWorkTime.from_api(payload.get("CurrentWorkTime"))
 
         return EasyjobData(
             date=payload.get("Date"),
@@ -304,10 +887,9 @@ class EasyjobClient:
         payload = await self._request("GET", path, auth=True)
 
         # v2 has no CurrentWorkTime field; IdTimeCardWorkTimeCurrent > 0 means active.
-        # Build a dict matching the v1 shape so the work_time sensor works unchanged.
         id_current = payload.get("IdTimeCardWorkTimeCurrent")
         try:
-            work_time = str({"ID": int(id_current)}) if id_current and int(id_current) > 0 else None
+            work_time = EasyjobWorkTime(id=int(id_current)) if id_current and int(id_current) > 0 else None
         except (TypeError, ValueError):
             work_time = None
 
@@ -339,14 +921,80 @@ class EasyjobClient:
         startdate = start.strftime("%Y-%m-%d")
         path = f"/api.json/dashboard/calendar/?days={days}&startdate={startdate}"
 
-        payload = await self._request("GET", path, auth=True)
-        items: list[dict[str, Any]] = payload or []
-
-        deny = DEFAULT_FILTERED_IDT if filtered_idt is None else filtered_idt
-        if not deny:
+        deny = frozenset(DEFAULT_FILTERED_IDT if filtered_idt is None else filtered_idt)
+
+        async def _decode(resp: aiohttp.ClientResponse) -> list[dict[str, Any]]:
+            # Streamed: only the used fields are kept, denied IdT never materialize. Decoded
+            # on the event loop, which gets a turn after every chunk.
+            stats = CalendarDecodeStats()
+            try:
+                items = await decode_calendar(resp, deny, stats)
+            except ValueError as err:  # incl. JSONDecodeError / UnicodeDecodeError
+                raise EasyjobRequestError(f"Invalid resource plan response: {err}") from err
+            self._record_json_decode(stats.seconds, stats.bytes)
+            self.metrics.calendar_items_kept += stats.kept
+            self.metrics.calendar_items_dropped += stats.dropped
             return items
 
-        return [it for it in items if it.get("IdT") not in deny]
+        return await self._request(
+            "GET",
+            path,
+            auth=True,
+            decoder=_decode,
+            decoder_variant="calendar:" + ",".join(map(str, sorted(deny, key=str))),
+        )
+
+    async def async_fetch_calendar_range(
+        self,
+        start: date,
+        end: date,
+        filtered_idt: list[int] | None = None,
+        *,
+        chunk_days: int,
+        max_concurrency: int,
+    ) -> list[dict[str, Any]]:
+        """Fetch [start, end) in chunks of `chunk_days`, concurrently, merged by Id.
+
+        Items spanning a chunk border are returned by both chunks; the first copy wins.
+        Any failed chunk fails the whole fetch (a partial plan would look like deletions).
+        """
+        chunks: list[tuple[date, date]] = []
+        chunk_start = start
+        while chunk_start < end:
+            chunk_end = min(chunk_start + timedelta(days=chunk_days), end)
+            chunks.append((chunk_start, chunk_end))
+            chunk_start = chunk_end
+        if not chunks:
+            chunks.append((start, start + timedelta(days=1)))
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _fetch(chunk: tuple[date, date]) -> list[dict[str, Any]]:
+            async with semaphore:
+                return await self.async_fetch_calendar(chunk[0], chunk[1], filtered_idt)
+
+        tasks = [asyncio.create_task(_fetch(chunk)) for chunk in chunks]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            # The result is lost anyway: free scheduler slots and retry budget, and retrieve
+            # the siblings' errors instead of leaving them unobserved
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        merged: dict[Any, dict[str, Any]] = {}
+        for items in results:
+            for item in items:
+                item_id = item.get("Id")
+                key = (
+                    ("id", item_id)
+                    if item_id is not None
+                    else ("item", item.get("IdT"), item.get("StartDate"), item.get("EndDate"), item.get("Caption"))
+                )
+                merged.setdefault(key, item)
+        return list(merged.values())
 
     async def async_get_idaddress(self, force: bool = False) -> int:
         """GET /api.json/Common/GetWebSettings -> IdAddress (cached)."""
@@ -5,9 +5,10 @@ from typing import Any
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_point_in_time
 from homeassistant.util import dt as dt_util
 
 PARALLEL_UPDATES = 0  # Coordinator handles all updates
@@ -15,7 +16,7 @@ PARALLEL_UPDATES = 0  # Coordinator handles all updates
 from . import RuntimeData
 from .const import CONF_STATUS_BINARY_SENSORS, DEFAULT_STATUS_BINARY_SENSORS, DOMAIN
 from .entity import EasyjobCoordinatorEntity
-from .util import parse_datetime
+from .timeline import ResourcePlanItem
 
 
 def _get_selected_status_ids(entry: ConfigEntry) -> list[int]:
@@ -36,6 +37,17 @@ def _norm_text(v: Any) -> str:
     return str(v).strip().casefold() if v is not None else ""
 
 
+def _item_attributes(prefix: str, item: ResourcePlanItem) -> dict[str, Any]:
+    return {
+        f"{prefix}_event_id": item.id,
+        f"{prefix}_caption": item.caption,
+        f"{prefix}_idt": item.id_t,
+        f"{prefix}_start": dt_util.as_local(item.start).isoformat(),
+        f"{prefix}_end": dt_util.as_local(item.end).isoformat(),
+        f"{prefix}_color": item.color,
+    }
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -126,8 +138,9 @@ async def async_setup_entry(
 class _BaseEasyjobBinarySensor(EasyjobCoordinatorEntity, BinarySensorEntity):
     _attr_has_entity_name = True
 
-    def __init__(self, runtime: RuntimeData, entry: ConfigEntry) -> None:
-        EasyjobCoordinatorEntity.__init__(self, runtime.coordinator, entry)
+    def __init__(self, runtime: RuntimeData, entry: ConfigEntry, coordinator=None) -> None:
+        # Default: details coordinator; calendar-based sensors pass the calendar coordinator
+        EasyjobCoordinatorEntity.__init__(self, coordinator or runtime.coordinator, entry)
         self._runtime = runtime
 
     @property
@@ -145,10 +158,31 @@ class EasyjobConnectedBinarySensor(_BaseEasyjobBinarySensor):
         super().__init__(runtime, entry)
         self._attr_unique_id = f"{self._uid_base}__connected"
 
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        # Breaker and poll policy live outside coordinator.data: unchanged data and
+        # consecutive failures don't notify listeners, so subscribe to them directly
+        # (the fingerprint check still skips writes when nothing visible changed).
+        self.async_on_remove(
+            self._runtime.client.circuit_breaker.add_listener(self._handle_coordinator_update)
+        )
+        self.async_on_remove(
+            self._runtime.coordinator.async_add_poll_listener(self._handle_coordinator_update)
+        )
+
     @property
     def is_on(self) -> bool:
         return bool(self.coordinator.last_update_success)
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        # Circuit breaker of the easyjob server (shared by all entries on that server)
+        # + nominal adaptive poll interval of this entry (jittered delay: diagnostics only)
+        return {
+            **self._runtime.client.circuit_breaker.as_dict(),
+            **self._runtime.coordinator.poll_policy.as_dict(),
+        }
+
 
 class EasyjobWorktimeActiveBinarySensor(_BaseEasyjobBinarySensor):
     _attr_translation_key = "worktime_active"
@@ -191,7 +225,8 @@ class EasyjobResourceStatusActiveBinarySensor(_BaseEasyjobBinarySensor):
         status_id: int,
         status_caption: str | None = None,
     ) -> None:
-        super().__init__(runtime, entry)
+        # Only woken by resource plan refreshes, not by the (more frequent) details polls
+        super().__init__(runtime, entry, coordinator=runtime.calendar_coordinator)
 
         self._status_id = int(status_id)
         self._status_caption = status_caption or None
@@ -205,105 +240,95 @@ class EasyjobResourceStatusActiveBinarySensor(_BaseEasyjobBinarySensor):
 
         self._attr_unique_id = f"{self._uid_base}__status_active_{self._status_id}"
 
-        self._active_item: dict[str, Any] | None = None
-        self._next_item: dict[str, Any] | None = None
+        self._active_item: ResourcePlanItem | None = None
+        self._next_item: ResourcePlanItem | None = None
         self._matching_count: int = 0
 
+        # Next start/end of a matching item -> timer flips the state exactly then (no polling)
+        self._next_change = None
+        self._unsub_boundary: CALLBACK_TYPE | None = None
+
+        # Memoized state per (coordinator generation, minute): all property reads of one
+        # state write share a single computation
+        self._memo_key: tuple[int, int] | None = None
+        self._memo_is_on = False
+
+        # Matching items come from the coordinator's shared per-status index
+        # (IdT lookup + one compiled caption matcher for all selected statuses)
+        self.coordinator.register_status(self._status_id, self._status_caption_norm)
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self._schedule_boundary_timer()
+
+    async def async_will_remove_from_hass(self) -> None:
+        self._cancel_boundary_timer()
+        self.coordinator.unregister_status(self._status_id)
+        await super().async_will_remove_from_hass()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        super()._handle_coordinator_update()
+        self._schedule_boundary_timer()
+
+    @callback
+    def _cancel_boundary_timer(self) -> None:
+        if self._unsub_boundary is not None:
+            self._unsub_boundary()
+            self._unsub_boundary = None
+
+    @callback
+    def _schedule_boundary_timer(self) -> None:
+        """(Re)arm a single timer at the next start/end of a matching resource plan item."""
+        self._cancel_boundary_timer()
+        self._compute_state()
+        if self._next_change is not None:
+            self._unsub_boundary = async_track_point_in_time(
+                self.hass, self._on_boundary, self._next_change
+            )
+
+    @callback
+    def _on_boundary(self, _now) -> None:
+        self._unsub_boundary = None
+        # Boundaries need not fall on a full minute -> don't trust the memo here
+        self._memo_key = None
+        self.async_write_ha_state()
+        self._schedule_boundary_timer()
+
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
+        self._compute_state()
         attrs: dict[str, Any] = {
             "status_id": self._status_id,
             "status_caption": self._status_caption,
             "matching_items_in_cache": self._matching_count,
-            "calendar_last_updated": getattr(self.coordinator, "calendar_last_updated", None),
+            # calendar_last_updated changes on every refresh: diagnostics only
             "calendar_last_error": getattr(self.coordinator, "calendar_last_error", None),
         }
         if self._active_item:
-            attrs.update(
-                {
-                    "active_event_id": self._active_item.get("Id"),
-                    "active_caption": self._active_item.get("Caption"),
-                    "active_idt": self._active_item.get("IdT"),
-                    "active_start": self._active_item.get("StartDate"),
-                    "active_end": self._active_item.get("EndDate"),
-                    "active_color": self._active_item.get("Color"),
-                }
-            )
+            attrs.update(_item_attributes("active", self._active_item))
         if self._next_item:
-            attrs.update(
-                {
-                    "next_event_id": self._next_item.get("Id"),
-                    "next_caption": self._next_item.get("Caption"),
-                    "next_idt": self._next_item.get("IdT"),
-                    "next_start": self._next_item.get("StartDate"),
-                    "next_end": self._next_item.get("EndDate"),
-                    "next_color": self._next_item.get("Color"),
-                }
-            )
+            attrs.update(_item_attributes("next", self._next_item))
         return attrs
 
-    def _event_matches_status(self, it: dict[str, Any]) -> bool:
-        try:
-            if int(it.get("IdT")) == self._status_id:
-                return True
-        except Exception:
-            pass
-
-        if not self._status_caption_norm:
-            return False
-
-        ev_cap_norm = _norm_text(it.get("Caption"))
-        if not ev_cap_norm:
-            return False
-
-        return ev_cap_norm == self._status_caption_norm or self._status_caption_norm in ev_cap_norm
-
-    def _iter_matching_items(self) -> list[dict[str, Any]]:
-        items = list(getattr(self._runtime.coordinator, "calendar_items", []) or [])
-        out: list[dict[str, Any]] = []
-        for it in items:
-            if self._event_matches_status(it):
-                out.append(it)
-        self._matching_count = len(out)
-        return out
-
-    def _to_local_dt(self, value: Any):
-        dt = parse_datetime(value)
-        if dt is None:
-            return None
-
-        if dt.tzinfo is None:
-            tz_name = getattr(self.coordinator.hass.config, "time_zone", None)
-            tz = dt_util.get_time_zone(tz_name) if tz_name else dt_util.DEFAULT_TIME_ZONE
-            return dt.replace(tzinfo=tz)
-
-        return dt_util.as_local(dt)
-
     def _compute_state(self) -> bool:
         now = dt_util.now()
-        matches = self._iter_matching_items()
-
-        active: list[tuple[Any, dict[str, Any]]] = []
-        upcoming: list[tuple[Any, dict[str, Any]]] = []
-
-        for it in matches:
-            start = self._to_local_dt(it.get("StartDate"))
-            end = self._to_local_dt(it.get("EndDate"))
-            if start is None or end is None:
-                continue
-
-            if start <= now < end:
-                active.append((start, it))
-            elif start >= now:
-                upcoming.append((start, it))
-
-        active.sort(key=lambda t: t[0])
-        upcoming.sort(key=lambda t: t[0])
-
-        self._active_item = active[0][1] if active else None
-        self._next_item = upcoming[0][1] if upcoming else None
-
-        return self._active_item is not None
+        self.coordinator.ensure_status_index()
+        memo_key = (self.coordinator.generation, int(now.timestamp()) // 60)
+        if memo_key == self._memo_key:
+            return self._memo_is_on
+
+        # O(1) between two boundaries: the status timeline memoizes its snapshot
+        snapshot = self.coordinator.status_at(self._status_id, now)
+
+        self._active_item = snapshot.active
+        self._next_item = snapshot.next
+        self._next_change = snapshot.next_change
+        self._matching_count = snapshot.matching_count
+
+        self._memo_key = memo_key
+        self._memo_is_on = self._active_item is not None
+        return self._memo_is_on
 
     @property
     def is_on(self) -> bool:
@@ -5,7 +5,8 @@ from typing import Any
 
 from homeassistant.components.calendar import CalendarEntity, CalendarEvent
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_time
 from homeassistant.util import dt as dt_util
 
 PARALLEL_UPDATES = 0  # Coordinator handles all updates
@@ -17,7 +18,7 @@ from .const import (
     DEFAULT_FILTERED_IDT,
 )
 from .entity import EasyjobBaseEntity
-from .util import parse_datetime
+from .timeline import ResourcePlanItem
 
 
 async def async_setup_entry(
@@ -50,6 +51,9 @@ class EasyjobResourcePlanCalendar(EasyjobBaseEntity, CalendarEntity):
         self._event: CalendarEvent | None = None
         self._event_color: str | None = None
 
+        # Timer at the current event's start/end: state flips exactly on time, no polling
+        self._unsub_boundary: CALLBACK_TYPE | None = None
+
         self._filtered_idt: list[int] = list(
             entry.options.get(CONF_FILTERED_IDT, DEFAULT_FILTERED_IDT)
         )
@@ -58,21 +62,46 @@ class EasyjobResourcePlanCalendar(EasyjobBaseEntity, CalendarEntity):
         # CalendarEntity ist auch eine HA Entity -> Basis-Added aufrufen
         await CalendarEntity.async_added_to_hass(self)
 
-        # Wenn der Coordinator neue Daten hat, Calendar-State neu berechnen
+        # Wenn der Kalender-Coordinator neue Daten hat, Calendar-State neu berechnen
         self.async_on_remove(
-            self._runtime.coordinator.async_add_listener(self._on_coordinator_update)
+            self._runtime.calendar_coordinator.async_add_listener(self._on_coordinator_update)
         )
 
         # beim Hinzufügen einmal initial berechnen
         self.async_schedule_update_ha_state(True)
 
+    async def async_will_remove_from_hass(self) -> None:
+        self._cancel_boundary_timer()
+        await CalendarEntity.async_will_remove_from_hass(self)
+
     def _on_coordinator_update(self) -> None:
         self.async_schedule_update_ha_state(True)
 
+    @callback
+    def _cancel_boundary_timer(self) -> None:
+        if self._unsub_boundary is not None:
+            self._unsub_boundary()
+            self._unsub_boundary = None
+
+    @callback
+    def _schedule_boundary_timer(self) -> None:
+        """Re-evaluate when the current event starts (off -> on) or ends (on -> next event)."""
+        self._cancel_boundary_timer()
+        if self._event is None:
+            return
+        now = dt_util.now()
+        when = self._event.start if self._event.start > now else self._event.end
+        self._unsub_boundary = async_track_point_in_time(self.hass, self._on_boundary, when)
+
+    @callback
+    def _on_boundary(self, _now) -> None:
+        self._unsub_boundary = None
+        self.async_schedule_update_ha_state(True)
+
 
     @property
     def available(self) -> bool:
-        return bool(self._runtime.coordinator.last_update_success)
+        return bool(self._runtime.calendar_coordinator.last_update_success)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -82,105 +111,56 @@ class EasyjobResourcePlanCalendar(EasyjobBaseEntity, CalendarEntity):
     def event(self) -> CalendarEvent | None:
         return self._event
 
-    def _tz(self):
-        return dt_util.get_time_zone(self.hass.config.time_zone)
-
-    def _build_description(self, item: dict[str, Any]) -> str | None:
-        pre = item.get("PreCaption")
-        post = item.get("PostCaption")
-
+    def _build_description(self, item: ResourcePlanItem) -> str | None:
         parts: list[str] = []
-        if pre:
-            parts.append(str(pre))
-        if post:
-            parts.append(str(post))
+        if item.pre_caption:
+            parts.append(str(item.pre_caption))
+        if item.post_caption:
+            parts.append(str(item.post_caption))
 
         return "\n".join(parts) if parts else None
 
-    def _parse_item(
-        self, item: dict[str, Any], tz
-    ) -> tuple[CalendarEvent, str | None] | None:
-        start_dt = parse_datetime(item.get("StartDate"))
-        end_dt = parse_datetime(item.get("EndDate"))
-        if start_dt is None or end_dt is None:
-            return None
-
-        if start_dt.tzinfo is None:
-            start_dt = start_dt.replace(tzinfo=tz)
-        if end_dt.tzinfo is None:
-            end_dt = end_dt.replace(tzinfo=tz)
-
-        uid = str(item.get("Id")) if item.get("Id") is not None else None
-        caption = item.get("Caption") or ""
-
-        ev = CalendarEvent(
-            summary=caption,
-            start=start_dt,
-            end=end_dt,
+    def _to_event(self, item: ResourcePlanItem) -> CalendarEvent:
+        return CalendarEvent(
+            summary=item.caption,
+            start=item.start,
+            end=item.end,
             description=self._build_description(item),
-            uid=uid,
+            uid=str(item.id) if item.id is not None else None,
         )
 
-        return ev, item.get("Color")
-
-    def _parse_items(
-        self, items: list[dict[str, Any]] | None
-    ) -> list[tuple[CalendarEvent, str | None]]:
-        tz = self._tz()
-        parsed: list[tuple[CalendarEvent, str | None]] = []
-
-        for it in items or []:
-            res = self._parse_item(it, tz)
-            if res is not None:
-                parsed.append(res)
-
-        return parsed
-
-    def _get_cached_items_filtered(self) -> list[dict[str, Any]]:
-        """Return cached calendar items filtered by IdT denylist from entry options.
-
-        IMPORTANT: CONF_FILTERED_IDT is treated as a *denylist* (same semantics as the old API call).
-        """
+    def _denied_idt(self) -> set[int]:
+        """IdT denylist from entry options (same semantics as the old API call)."""
         # Options können sich ändern -> beim Update frisch lesen
         self._filtered_idt = list(
             self._entry.options.get(CONF_FILTERED_IDT, DEFAULT_FILTERED_IDT)
         )
 
-        items: list[dict[str, Any]] = list(
-            getattr(self._runtime.coordinator, "calendar_items", []) or []
-        )
-
         deny: set[int] = set()
         for v in self._filtered_idt or []:
             try:
                 deny.add(int(v))
             except Exception:
                 continue
-
-        if not deny:
-            return items
-
-        # Denylist: alles behalten, außer IdT in deny
-        return [it for it in items if it.get("IdT") not in deny]
+        return deny
 
     async def async_update(self) -> None:
         """Aktualisiert den Kalender-State (nächstes/aktuelles Event) + dessen Farbe.
 
-        Keine API Calls mehr: Daten kommen aus dem Coordinator-Cache.
+        Keine API Calls mehr: Daten kommen aus dem Interval-Index des Coordinators.
         """
         now = dt_util.now()
+        deny = self._denied_idt()
 
-        items = self._get_cached_items_filtered()
-        parsed = self._parse_items(items)
-
-        # "upcoming": alles, was noch nicht vorbei ist
-        upcoming = [(ev, color) for (ev, color) in parsed if ev.end >= now]
-        upcoming.sort(key=lambda t: t[0].start)
+        # erstes Event (nach Start), das noch nicht vorbei ist
+        self._event, self._event_color = None, None
+        for item in self._runtime.calendar_coordinator.timeline.iter_not_ended(now):
+            if item.id_t in deny:
+                continue
+            self._event, self._event_color = self._to_event(item), item.color
+            break
 
-        if upcoming:
-            self._event, self._event_color = upcoming[0]
-        else:
-            self._event, self._event_color = None, None
+        self._schedule_boundary_timer()
 
     async def async_get_events(
         self,
@@ -188,18 +168,12 @@ class EasyjobResourcePlanCalendar(EasyjobBaseEntity, CalendarEntity):
         start_date: datetime,
         end_date: datetime,
     ) -> list[CalendarEvent]:
-        """Return events in range (best effort) from coordinator cache."""
-        items = self._get_cached_items_filtered()
-        parsed = self._parse_items(items)
-
-        # Overlap-Check: Event überschneidet sich mit [start_date, end_date]
-        events: list[CalendarEvent] = []
-        for ev, _color in parsed:
-            if ev.end < start_date:
-                continue
-            if ev.start > end_date:
-                continue
-            events.append(ev)
-
-        events.sort(key=lambda e: e.start)
-        return events
+        """Return events in range (best effort) from the coordinator's interval index."""
+        deny = self._denied_idt()
+
+        # Overlap: Event überschneidet sich mit [start_date, end_date], bereits nach Start sortiert
+        return [
+            self._to_event(item)
+            for item in self._runtime.calendar_coordinator.timeline.overlapping(start_date, end_date)
+            if item.id_t not in deny
+        ]
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+import time
+from typing import Any, Callable
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Circuit breaker for one easyjob server (shared by all clients with the same base_url).
+
+    - closed: requests pass; consecutive connect failures are counted
+    - open: after `failure_threshold` failures requests fail fast until the next probe is due.
+      Every attempt counts, so the default stays above RetryPolicy.max_attempts: the retries of
+      a single request must not lock out all accounts on the server.
+    - half_open: exactly one probe request passes; success closes the circuit,
+      failure re-opens it with a doubled probe interval (capped at `max_probe_interval`)
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        probe_interval: float = 30.0,
+        max_probe_interval: float = 600.0,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.base_probe_interval = probe_interval
+        self.max_probe_interval = max_probe_interval
+
+        self.state = STATE_CLOSED
+        self.consecutive_failures = 0
+        self.probe_interval = probe_interval
+        self.opened_at: datetime | None = None
+        self.next_probe_at: datetime | None = None
+
+        self._next_probe_monotonic = 0.0
+        self._probe_in_flight = False
+        self._listeners: list[Callable[[], None]] = []
+
+    def add_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """Call `listener` whenever as_dict() changes; returns a function that removes it."""
+        self._listeners.append(listener)
+
+        def _remove() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+        return _remove
+
+    def _notify(self) -> None:
+        for listener in list(self._listeners):
+            listener()
+
+    def allow_request(self) -> bool:
+        """Return True if a request may be sent now (in half_open: only the single probe)."""
+        if self.state == STATE_CLOSED:
+            return True
+        if self.state == STATE_OPEN:
+            if time.monotonic() < self._next_probe_monotonic:
+                return False
+            self.state = STATE_HALF_OPEN
+            self._notify()
+        if self._probe_in_flight:
+            return False
+        self._probe_in_flight = True
+        return True
+
+    def record_success(self) -> None:
+        """The server answered (any HTTP status): it is reachable."""
+        changed = self.state != STATE_CLOSED or self.consecutive_failures > 0
+        self.state = STATE_CLOSED
+        self.consecutive_failures = 0
+        self.probe_interval = self.base_probe_interval
+        self.opened_at = None
+        self.next_probe_at = None
+        self._probe_in_flight = False
+        if changed:
+            self._notify()
+
+    def record_failure(self) -> None:
+        """Connect failure / timeout."""
+        self.consecutive_failures += 1
+        if self.state == STATE_HALF_OPEN:
+            self.probe_interval = min(self.max_probe_interval, self.probe_interval * 2)
+            self._open()
+        elif self.state == STATE_CLOSED and self.consecutive_failures >= self.failure_threshold:
+            self._open()
+        self._notify()
+
+    def release_probe(self) -> None:
+        """Probe ended without a verdict (e.g. cancelled): let the next request probe."""
+        if self.state == STATE_HALF_OPEN:
+            self._probe_in_flight = False
+
+    def _open(self) -> None:
+        self.state = STATE_OPEN
+        self._probe_in_flight = False
+        now = datetime.now(timezone.utc)
+        if self.opened_at is None:
+            self.opened_at = now
+        self.next_probe_at = now + timedelta(seconds=self.probe_interval)
+        self._next_probe_monotonic = time.monotonic() + self.probe_interval
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "circuit_state": self.state,
+            "circuit_consecutive_failures": self.consecutive_failures,
+            "circuit_opened_at": self.opened_at,
+            "circuit_next_probe_at": self.next_probe_at,
+        }
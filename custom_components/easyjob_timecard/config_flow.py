@@ -23,10 +23,87 @@ from .const import (
     API_VERSION_V2,
     CONF_STATUS_BINARY_SENSORS,
     DEFAULT_STATUS_BINARY_SENSORS,
+    CONF_DEDICATED_CONNECTION,
+    CONF_CONNECTION_LIMIT,
+    CONF_KEEPALIVE_TIMEOUT,
+    CONF_DNS_CACHE_TTL,
+    CONF_CONNECT_TIMEOUT,
+    CONF_READ_TIMEOUT,
+    CONF_JSON_OFFLOAD_KB,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_LOOKBEHIND_DAYS,
+    CONF_LOOKAHEAD_DAYS,
+    DEFAULT_DEDICATED_CONNECTION,
+    DEFAULT_CONNECTION_LIMIT,
+    DEFAULT_KEEPALIVE_TIMEOUT,
+    DEFAULT_DNS_CACHE_TTL,
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_READ_TIMEOUT,
+    DEFAULT_JSON_OFFLOAD_KB,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_LOOKBEHIND_DAYS,
+    DEFAULT_LOOKAHEAD_DAYS,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Connection tuning options: key -> (default, validator)
+_CONNECTION_OPTIONS = {
+    CONF_DEDICATED_CONNECTION: (DEFAULT_DEDICATED_CONNECTION, bool),
+    CONF_CONNECTION_LIMIT: (
+        DEFAULT_CONNECTION_LIMIT,
+        vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
+    ),
+    CONF_KEEPALIVE_TIMEOUT: (
+        DEFAULT_KEEPALIVE_TIMEOUT,
+        vol.All(vol.Coerce(int), vol.Range(min=1, max=3600)),
+    ),
+    CONF_DNS_CACHE_TTL: (
+        DEFAULT_DNS_CACHE_TTL,
+        vol.All(vol.Coerce(int), vol.Range(min=0, max=86400)),
+    ),
+    CONF_CONNECT_TIMEOUT: (
+        DEFAULT_CONNECT_TIMEOUT,
+        vol.All(vol.Coerce(int), vol.Range(min=1, max=120)),
+    ),
+    CONF_READ_TIMEOUT: (
+        DEFAULT_READ_TIMEOUT,
+        vol.All(vol.Coerce(int), vol.Range(min=1, max=600)),
+    ),
+    CONF_JSON_OFFLOAD_KB: (
+        DEFAULT_JSON_OFFLOAD_KB,
+        vol.All(vol.Coerce(int), vol.Range(min=0, max=64 * 1024)),
+    ),
+}
+
+# Adaptive polling bounds: key -> (default, validator)
+_POLLING_OPTIONS = {
+    CONF_MIN_SCAN_INTERVAL: (
+        DEFAULT_MIN_SCAN_INTERVAL,
+        vol.All(vol.Coerce(int), vol.Range(min=10, max=3600)),
+    ),
+    CONF_MAX_SCAN_INTERVAL: (
+        DEFAULT_MAX_SCAN_INTERVAL,
+        vol.All(vol.Coerce(int), vol.Range(min=10, max=24 * 3600)),
+    ),
+}
+
+# Resource plan window around today: key -> (default, validator)
+_CALENDAR_OPTIONS = {
+    CONF_LOOKBEHIND_DAYS: (
+        DEFAULT_LOOKBEHIND_DAYS,
+        vol.All(vol.Coerce(int), vol.Range(min=0, max=365)),
+    ),
+    CONF_LOOKAHEAD_DAYS: (
+        DEFAULT_LOOKAHEAD_DAYS,
+        vol.All(vol.Coerce(int), vol.Range(min=1, max=730)),
+    ),
+}
+
+_TUNING_OPTIONS = {**_CONNECTION_OPTIONS, **_POLLING_OPTIONS, **_CALENDAR_OPTIONS}
+
 
 def _normalize_multi_select_to_int_list(value) -> list[int]:
     """Convert HA multi_select output to a sorted list[int]."""
@@ -362,6 +439,10 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     CONF_STATUS_BINARY_SENSORS,
                     default=_to_str_list(default_status_ids),
                 ): cv.multi_select(self._types_map),
+                **{
+                    vol.Optional(key, default=self._config_entry.options.get(key, default)): validator
+                    for key, (default, validator) in _TUNING_OPTIONS.items()
+                },
             }
         )
 
@@ -422,6 +503,10 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 user_input[CONF_USERNAME],
             ):
                 errors["base"] = "already_configured"
+            elif user_input.get(CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL) > user_input.get(
+                CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL
+            ):
+                errors[CONF_MIN_SCAN_INTERVAL] = "min_scan_interval_above_max"
             else:
                 errors = await self._validate_input(user_input, "options flow")
 
@@ -452,10 +537,10 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 status_ids = _normalize_multi_select_to_int_list(
                     user_input.get(CONF_STATUS_BINARY_SENSORS)
                 )
-                return self.async_create_entry(
-                    title="",
-                    data={CONF_STATUS_BINARY_SENSORS: status_ids},
-                )
+                options = {CONF_STATUS_BINARY_SENSORS: status_ids}
+                for key, (default, _validator) in _TUNING_OPTIONS.items():
+                    options[key] = user_input.get(key, default)
+                return self.async_create_entry(title="", data=options)
 
         return self.async_show_form(
             step_id="init",
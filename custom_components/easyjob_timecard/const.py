@@ -28,11 +28,61 @@ DEFAULT_API_VERSION = API_VERSION_V1
 
 DEFAULT_SCAN_INTERVAL_SECONDS = 60
 
+# Adaptive details polling bounds (options flow)
+CONF_MIN_SCAN_INTERVAL = "min_scan_interval"
+DEFAULT_MIN_SCAN_INTERVAL = 30
+CONF_MAX_SCAN_INTERVAL = "max_scan_interval"
+DEFAULT_MAX_SCAN_INTERVAL = 15 * 60
+
+# Slower sources refreshed by the coordinator only when due
+DEFAULT_CALENDAR_REFRESH_SECONDS = 15 * 60
+DEFAULT_GLOBAL_SETTINGS_REFRESH_SECONDS = 24 * 60 * 60
+
+# Connection tuning (options flow)
+CONF_DEDICATED_CONNECTION = "dedicated_connection"
+DEFAULT_DEDICATED_CONNECTION = False
+CONF_CONNECTION_LIMIT = "connection_limit"
+DEFAULT_CONNECTION_LIMIT = 10
+CONF_KEEPALIVE_TIMEOUT = "keepalive_timeout"
+DEFAULT_KEEPALIVE_TIMEOUT = 30
+CONF_DNS_CACHE_TTL = "dns_cache_ttl"
+DEFAULT_DNS_CACHE_TTL = 300
+CONF_CONNECT_TIMEOUT = "connect_timeout"
+DEFAULT_CONNECT_TIMEOUT = 10
+CONF_READ_TIMEOUT = "read_timeout"
+DEFAULT_READ_TIMEOUT = 20
+# JSON responses at least this large (KiB) are decoded off the event loop; 0 = never
+CONF_JSON_OFFLOAD_KB = "json_offload_kb"
+DEFAULT_JSON_OFFLOAD_KB = 256
+
+# Domain-wide request scheduler (shared by all config entries, budget per easyjob host)
+SCHEDULER_RATE_PER_SECOND = 5.0
+SCHEDULER_BURST = 10
+SCHEDULER_MAX_CONCURRENCY = 4
+
+# Persisted bearer token (homeassistant.helpers.storage.Store)
+TOKEN_STORAGE_VERSION = 1
+
 # Calendar filtering (IdT values)
 DEFAULT_FILTERED_IDT = [34, 3]
 CONF_FILTERED_IDT = "filtered_idt"
 
+# Resource plan window around today (options flow); large windows are fetched in chunks
+CONF_LOOKBEHIND_DAYS = "lookbehind_days"
+DEFAULT_LOOKBEHIND_DAYS = 0
+CONF_LOOKAHEAD_DAYS = "lookahead_days"
 DEFAULT_LOOKAHEAD_DAYS = 30
+CALENDAR_CHUNK_DAYS = 31
+CALENDAR_MAX_CONCURRENT_CHUNKS = 3
+
+# GET response cache: path prefix -> seconds a response is reused without asking the server.
+# Endpoints that send ETag/Last-Modified are additionally revalidated with conditional requests.
+DEFAULT_CACHE_TTLS: dict[str, int] = {
+    "/api.json/Common/GetGlobalWebSettings": 3600,
+    "/api.json/Common/GetWebSettings": 300,
+    "/api.json/ResourceStates/GetFormData": 300,
+    "/api.json/dashboard/calendar/": 300,
+}
 
 # New: dynamic resource status binary sensors (list of IdResourceStateType)
 CONF_STATUS_BINARY_SENSORS = "status_binary_sensors"
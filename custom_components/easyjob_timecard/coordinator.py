@@ -1,29 +1,92 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import timedelta
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import hashlib
 import logging
+import time
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
 
-from .api import EasyjobClient, EasyjobAuthError
-from .const import DEFAULT_LOOKAHEAD_DAYS, DEFAULT_SCAN_INTERVAL_SECONDS
+from .api import EasyjobClient, EasyjobAuthError, EasyjobData
+from .const import (
+    DEFAULT_CALENDAR_REFRESH_SECONDS,
+    DEFAULT_GLOBAL_SETTINGS_REFRESH_SECONDS,
+    CALENDAR_CHUNK_DAYS,
+    CALENDAR_MAX_CONCURRENT_CHUNKS,
+    DEFAULT_LOOKAHEAD_DAYS,
+    DEFAULT_LOOKBEHIND_DAYS,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_SCAN_INTERVAL_SECONDS,
+)
+from .polling import REASON_BOUNDARY, AdaptivePollPolicy
+from .retry import RetryBudget
+from .timeline import (
+    IntervalIndex,
+    ResourcePlanItem,
+    StatusSnapshot,
+    StatusTimeline,
+    build_status_timelines,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class EasyjobCoordinator(DataUpdateCoordinator):
-    """Coordinator for easyjob timecard details + resource plan calendar cache.
+def phase_offset(key: str, interval_seconds: float) -> float:
+    """Deterministic offset in [0, interval) derived from a stable key (e.g. entry.unique_id)."""
+    digest = hashlib.sha256(key.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") / 2**64 * interval_seconds
 
-    Notes:
-    - `coordinator.data` stays the *details* object (backwards compatible for existing entities).
-    - Calendar items are cached on the coordinator as `self.calendar_items`.
-    - Calendar fetch failures are NON-FATAL (details still update), so entities don't go unavailable
-      just because the calendar endpoint had a hiccup.
+
+def seconds_until_phase(interval_seconds: float, offset: float, now: float | None = None) -> float:
+    """Seconds until the next wall-clock slot t with t % interval == offset.
+
+    At least half an interval, so aligning never causes an extra poll right after a refresh.
     """
+    now = time.time() if now is None else now
+    delay = interval_seconds - ((now - offset) % interval_seconds)
+    if delay < interval_seconds / 2:
+        delay += interval_seconds
+    return delay
+
+
+SOURCE_DETAILS = "details"
+SOURCE_GLOBAL_SETTINGS = "global_settings"
+
+
+@dataclass
+class SourceState:
+    """Refresh bookkeeping for one data source of the coordinator."""
+
+    interval: timedelta
+    last_updated: datetime | None = None
+    last_error: str | None = None
+
+    def is_due(self, now: datetime) -> bool:
+        if self.last_updated is None or self.last_error is not None:
+            return True
+        return now - self.last_updated >= self.interval
+
+    def record_success(self, now: datetime) -> None:
+        self.last_updated = now
+        self.last_error = None
+
+    def record_error(self, err: BaseException) -> None:
+        self.last_error = str(err)
+
+
+async def _skipped() -> None:
+    """Placeholder for sources that are not due in this cycle."""
+    return None
+
+
+class _EasyjobBaseCoordinator(DataUpdateCoordinator):
+    """Shared plumbing: client/entry, phase-staggered scheduling."""
 
     def __init__(
         self,
@@ -31,79 +94,196 @@ class EasyjobCoordinator(DataUpdateCoordinator):
         client: EasyjobClient,
         entry: ConfigEntry,
         *,
-        lookahead_days: int = DEFAULT_LOOKAHEAD_DAYS,
+        name: str,
+        interval_seconds: int,
+        phase_key: str,
+        always_update: bool = True,
     ) -> None:
         super().__init__(
             hass,
             _LOGGER,
-            name="easyjob_timecard",
-            update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL_SECONDS),
+            name=name,
+            update_interval=timedelta(seconds=interval_seconds),
+            always_update=always_update,
         )
         self.client = client
         self._entry = entry
-        self.lookahead_days = lookahead_days
 
-        # Cached calendar items (resource plan)
-        self.calendar_items: list[dict] = []
-        self.calendar_last_updated = None
-        self.calendar_last_error: str | None = None
+        # Phase-staggered polling: every entry refreshes at its own fixed offset within the
+        # interval, so N entries (all set up at boot) don't hit the server in the same second.
+        # The offset is kept as a fraction so it scales with a changing (adaptive) interval.
+        self.scan_interval_seconds = interval_seconds
+        self._phase_fraction = phase_offset(phase_key, 1.0)
+
+        # Own retry allowance per cycle: details and calendar cycles overlap on the same client
+        self.retry_budget = RetryBudget()
+
+    @property
+    def phase_offset(self) -> float:
+        return self._phase_fraction * self.scan_interval_seconds
+
+    def _schedule_next(self, interval_seconds: float) -> None:
+        """Next poll at this entry's phase slot of `interval_seconds` (applied by HA after the update)."""
+        self.scan_interval_seconds = interval_seconds
+        self.update_interval = timedelta(
+            seconds=seconds_until_phase(self.scan_interval_seconds, self.phase_offset)
+        )
+
+    def _prepare_cycle(self) -> None:
+        # Fresh retry allowance for this cycle (shared by all requests of this coordinator)
+        self.retry_budget.reset()
+
+        # Default for this cycle (also used on failure): same interval as before
+        self._schedule_next(self.scan_interval_seconds)
+
+
+class EasyjobCoordinator(_EasyjobBaseCoordinator):
+    """Coordinator for easyjob timecard details (+ global web settings).
+
+    Notes:
+    - `coordinator.data` stays the *details* object (backwards compatible for existing entities).
+    - The resource plan lives in its own `EasyjobCalendarCoordinator`, so entities reading
+      details are not woken by calendar refreshes and vice versa.
+    - Each source has its own refresh interval and last-updated/last-error state (`self.sources`).
+    - Listeners are only notified when the details changed (or the success state flipped).
+    - The poll interval adapts (`poll_policy`) between the configured min/max bounds.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: EasyjobClient,
+        entry: ConfigEntry,
+        *,
+        calendar_coordinator: EasyjobCalendarCoordinator | None = None,
+        min_interval: int = DEFAULT_MIN_SCAN_INTERVAL,
+        max_interval: int = DEFAULT_MAX_SCAN_INTERVAL,
+    ) -> None:
+        super().__init__(
+            hass,
+            client,
+            entry,
+            name="easyjob_timecard",
+            interval_seconds=DEFAULT_SCAN_INTERVAL_SECONDS,
+            phase_key=entry.unique_id or entry.entry_id,
+            # EasyjobData compares by value: an unchanged payload does not wake the entities
+            always_update=False,
+        )
+
+        # Independent refresh rates per data source (details: every poll)
+        self.sources: dict[str, SourceState] = {
+            SOURCE_DETAILS: SourceState(interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL_SECONDS)),
+            SOURCE_GLOBAL_SETTINGS: SourceState(
+                interval=timedelta(seconds=DEFAULT_GLOBAL_SETTINGS_REFRESH_SECONDS)
+            ),
+        }
 
         # Cached Web API version (from GetGlobalWebSettings)
         self.web_api_version: str | None = None
-        self.web_api_version_last_error: str | None = None
+
+        # Adaptive poll interval: fast while working / around resource plan starts+ends,
+        # backing off while idle and at night/weekends. Boundaries come from the calendar.
+        self.calendar_coordinator = calendar_coordinator
+        self.poll_policy = AdaptivePollPolicy(
+            min_interval=min_interval,
+            base_interval=DEFAULT_SCAN_INTERVAL_SECONDS,
+            max_interval=max_interval,
+        )
+        # The poll policy is not part of `data` (always_update=False would hide its changes)
+        self._poll_listeners: list[CALLBACK_TYPE] = []
+
+    @callback
+    def async_add_poll_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Call `update_callback` after every details poll (once its next delay is scheduled)."""
+        self._poll_listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            if update_callback in self._poll_listeners:
+                self._poll_listeners.remove(update_callback)
+
+        return remove_listener
+
+    def _calendar_boundaries(self) -> IntervalIndex | None:
+        if self.calendar_coordinator is None:
+            return None
+        return self.calendar_coordinator.timeline
+
+    def _schedule_adaptive(self, details: EasyjobData) -> None:
+        policy = self.poll_policy
+        interval = policy.next_interval(
+            dt_util.now(),
+            active=details.work_time is not None,
+            changed=details != self.data,
+            boundaries=self._calendar_boundaries(),
+        )
+        if policy.reason == REASON_BOUNDARY or policy.boundary_limited:
+            # Start/end times are shared by many users: no phase alignment (it could stretch the
+            # interval up to 1.5x and oversleep the boundary), only a small per-entry jitter
+            # that stays well inside the boundary window.
+            self.scan_interval_seconds = interval
+            jitter = self._phase_fraction * min(policy.min_interval, policy.boundary_window / 2)
+            self.update_interval = timedelta(seconds=interval + jitter)
+        else:
+            self._schedule_next(interval)
+
+    @callback
+    def _async_publish_poll_schedule(self) -> None:
+        self.poll_policy.scheduled_delay = self.update_interval.total_seconds()
+        for update_callback in list(self._poll_listeners):
+            update_callback()
+
+    @property
+    def web_api_version_last_error(self) -> str | None:
+        return self.sources[SOURCE_GLOBAL_SETTINGS].last_error
 
     async def _async_update_data(self):
-        """Fetch timecard details and refresh cached calendar items.
+        """Fetch timecard details and refresh global web settings when due.
 
-        Details fetch is REQUIRED. Calendar fetch is BEST-EFFORT.
-        Global web settings fetch is BEST-EFFORT (used for sw_version).
+        Details fetch is REQUIRED (every poll).
+        Global web settings fetch is BEST-EFFORT (used for sw_version, daily).
         """
+        self._prepare_cycle()
+
+        now = dt_util.utcnow()
+        global_settings_due = self.sources[SOURCE_GLOBAL_SETTINGS].is_due(now)
+
         # Always fetch details (core data for existing entities)
         details_task = self.client.async_fetch_details_versioned()
 
-        # Fetch calendar for a lookahead window; keep unfiltered here so other features can use it.
-        start = dt_util.now().date()
-        end = start + timedelta(days=self.lookahead_days)
-        calendar_task = self.client.async_fetch_calendar(
-            start=start,
-            end=end,
-            filtered_idt=[],  # do NOT apply filtering in the coordinator cache
-        )
-
         # Fetch global web settings to extract WebApiVersion (best-effort)
-        global_settings_task = self.client.async_get_global_web_settings()
+        global_settings_task = (
+            self.client.async_get_global_web_settings() if global_settings_due else None
+        )
 
+        scheduled = False
         try:
-            details_result, calendar_result, global_settings_result = await asyncio.gather(
-                details_task,
-                calendar_task,
-                global_settings_task,
-                return_exceptions=True,
-            )
+            with self.client.retry_cycle(self.retry_budget):
+                details_result, global_settings_result = await asyncio.gather(
+                    details_task,
+                    global_settings_task or _skipped(),
+                    return_exceptions=True,
+                )
 
             # Details failures are fatal (integration data is stale/unreliable)
             if isinstance(details_result, Exception):
+                self.sources[SOURCE_DETAILS].record_error(details_result)
                 raise details_result
-
-            # Calendar failures are non-fatal; keep last known cache and expose error
-            if isinstance(calendar_result, Exception):
-                self.calendar_last_error = str(calendar_result)
-                _LOGGER.debug("Calendar update failed (non-fatal): %s", calendar_result)
-            else:
-                self.calendar_items = calendar_result or []
-                self.calendar_last_updated = dt_util.utcnow()
-                self.calendar_last_error = None
+            self.sources[SOURCE_DETAILS].record_success(now)
+            self._schedule_adaptive(details_result)
+            scheduled = True
 
             # Global settings failures are non-fatal; keep last known version and expose error
-            if isinstance(global_settings_result, Exception):
-                self.web_api_version_last_error = str(global_settings_result)
-                _LOGGER.debug(
-                    "GlobalWebSettings update failed (non-fatal): %s", global_settings_result
-                )
-            else:
-                version = global_settings_result.get("easyjobVersion") if isinstance(global_settings_result, dict) else None
-                self.web_api_version = str(version) if version else None
-                self.web_api_version_last_error = None
+            if global_settings_due:
+                if isinstance(global_settings_result, Exception):
+                    self.sources[SOURCE_GLOBAL_SETTINGS].record_error(global_settings_result)
+                    _LOGGER.debug(
+                        "GlobalWebSettings update failed (non-fatal): %s", global_settings_result
+                    )
+                else:
+                    version = global_settings_result.get("easyjobVersion") if isinstance(global_settings_result, dict) else None
+                    self.web_api_version = str(version) if version else None
+                    self.sources[SOURCE_GLOBAL_SETTINGS].record_success(now)
 
             return details_result
 
@@ -112,3 +292,143 @@ class EasyjobCoordinator(DataUpdateCoordinator):
             raise UpdateFailed(str(err)) from err
         except Exception as err:
             raise UpdateFailed(str(err)) from err
+        finally:
+            if not scheduled and self.data is not None:
+                # Failed poll: retry on the adaptive schedule as well, so an upcoming boundary
+                # is not overslept by the phase-aligned default of _prepare_cycle
+                self._schedule_adaptive(self.data)
+            # Also after failures: the delay until the retry is what users want to see
+            self._async_publish_poll_schedule()
+
+
+class EasyjobCalendarCoordinator(_EasyjobBaseCoordinator):
+    """Coordinator for the resource plan (calendar items), sharing the details client.
+
+    Notes:
+    - `coordinator.data` / `coordinator.calendar_items` is the unfiltered list of parsed
+      `ResourcePlanItem`s (built once per refresh; unused API fields are dropped).
+    - `coordinator.timeline` is an interval index over the same items, rebuilt once per refresh.
+    - Status binary sensors register their status; the per-status item lists are rebuilt once per
+      refresh (shared by all sensors), lookups via `status_at()`.
+    - Fetch failures are NON-FATAL: the last known items are kept and the error is exposed via
+      `calendar_last_error`, so calendar/status entities don't go unavailable on a hiccup.
+      A failed refresh is retried after `retry_interval`, then the regular interval resumes.
+      Auth problems are handled (reauth) by the details coordinator.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: EasyjobClient,
+        entry: ConfigEntry,
+        *,
+        lookbehind_days: int = DEFAULT_LOOKBEHIND_DAYS,
+        lookahead_days: int = DEFAULT_LOOKAHEAD_DAYS,
+        retry_interval: int = DEFAULT_MIN_SCAN_INTERVAL,
+    ) -> None:
+        super().__init__(
+            hass,
+            client,
+            entry,
+            name="easyjob_timecard_calendar",
+            interval_seconds=DEFAULT_CALENDAR_REFRESH_SECONDS,
+            phase_key=f"{entry.unique_id or entry.entry_id}|calendar",
+            # Time-driven changes are handled by the entities' boundary timers
+            always_update=False,
+        )
+        self.lookbehind_days = lookbehind_days
+        self.lookahead_days = lookahead_days
+        # A failed refresh is retried after this short delay instead of the full interval
+        self.retry_interval = retry_interval
+        self.source = SourceState(interval=timedelta(seconds=DEFAULT_CALENDAR_REFRESH_SECONDS))
+        self.timeline = IntervalIndex()
+
+        # Per-status index: status_id -> normalized caption / matching items.
+        # Rebuilt lazily after (un)registrations, so setting up M sensors costs one build.
+        self._statuses: dict[int, str] = {}
+        self._statuses_dirty = False
+        self.status_timelines: dict[int, StatusTimeline] = {}
+
+        # Bumped whenever the indexes are rebuilt; entities key memoized results on it
+        self.generation = 0
+
+    @property
+    def calendar_items(self) -> list[ResourcePlanItem]:
+        return self.data or []
+
+    @property
+    def calendar_last_updated(self) -> datetime | None:
+        return self.source.last_updated
+
+    @property
+    def calendar_last_error(self) -> str | None:
+        return self.source.last_error
+
+    def register_status(self, status_id: int, caption_norm: str) -> None:
+        self._statuses[status_id] = caption_norm
+        self._statuses_dirty = True
+
+    def unregister_status(self, status_id: int) -> None:
+        self._statuses.pop(status_id, None)
+        self._statuses_dirty = True
+
+    def ensure_status_index(self) -> None:
+        if self._statuses_dirty:
+            self._rebuild_status_index(self.calendar_items)
+
+    def status_at(self, status_id: int, now: datetime) -> StatusSnapshot:
+        self.ensure_status_index()
+        return self.status_timelines[status_id].at(now)
+
+    def _rebuild_status_index(self, items: list[ResourcePlanItem]) -> None:
+        self.status_timelines = build_status_timelines(items, self._statuses)
+        self._statuses_dirty = False
+        self.generation += 1
+
+    def _rebuild_indexes(self, items: list[ResourcePlanItem]) -> None:
+        self.timeline = IntervalIndex(items)
+        self._rebuild_status_index(items)
+
+    async def _async_update_data(self) -> list[ResourcePlanItem]:
+        last_error = self.source.last_error
+        items = await self._async_fetch_items()
+        if items == self.data and self.source.last_error != last_error:
+            # Unchanged items don't notify (always_update=False), but the status sensors expose
+            # calendar_last_error: let them write a failure or the recovery from one
+            self.async_update_listeners()
+        return items
+
+    async def _async_fetch_items(self) -> list[ResourcePlanItem]:
+        self._prepare_cycle()
+
+        # Fetch calendar for the lookbehind/lookahead window (in concurrent chunks);
+        # keep unfiltered here so other features can use it.
+        today = dt_util.now().date()
+        start = today - timedelta(days=self.lookbehind_days)
+        end = today + timedelta(days=self.lookahead_days)
+        try:
+            with self.client.retry_cycle(self.retry_budget):
+                items = await self.client.async_fetch_calendar_range(
+                    start=start,
+                    end=end,
+                    filtered_idt=[],  # do NOT apply filtering in the coordinator cache
+                    chunk_days=CALENDAR_CHUNK_DAYS,
+                    max_concurrency=CALENDAR_MAX_CONCURRENT_CHUNKS,
+                )
+        except Exception as err:
+            # Calendar failures are non-fatal; keep last known cache and expose error
+            self.source.record_error(err)
+            _LOGGER.debug("Calendar update failed (non-fatal): %s", err)
+            self._schedule_next(self.retry_interval)
+            return self.calendar_items
+
+        self.source.record_success(dt_util.utcnow())
+        self._schedule_next(DEFAULT_CALENDAR_REFRESH_SECONDS)
+        parsed = [
+            plan_item
+            for plan_item in map(ResourcePlanItem.from_api, items or [])
+            if plan_item is not None
+        ]
+        if parsed != self.data:
+            self._rebuild_indexes(parsed)
+        return parsed
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from dataclasses import asdict
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
@@ -18,6 +19,7 @@ async def async_get_config_entry_diagnostics(
     runtime: RuntimeData | None = domain_data.get("entries", {}).get(entry.entry_id)
 
     coordinator = runtime.coordinator if runtime else None
+    calendar_coordinator = runtime.calendar_coordinator if runtime else None
 
     data: dict[str, Any] = {
         "entry": {
@@ -32,11 +34,33 @@ async def async_get_config_entry_diagnostics(
         "coordinator": {
             "last_update_success": getattr(coordinator, "last_update_success", None),
             "last_exception": str(getattr(coordinator, "last_exception", "") or ""),
-            "calendar_last_error": getattr(coordinator, "calendar_last_error", None),
-            "calendar_last_updated": str(getattr(coordinator, "calendar_last_updated", None)),
             "web_api_version": getattr(coordinator, "web_api_version", None),
             "web_api_version_last_error": getattr(coordinator, "web_api_version_last_error", None),
+            "phase_offset_seconds": getattr(coordinator, "phase_offset", None),
+            "sources": {
+                name: {
+                    "interval": str(src.interval),
+                    "last_updated": str(src.last_updated),
+                    "last_error": src.last_error,
+                }
+                for name, src in getattr(coordinator, "sources", {}).items()
+            },
+            "update_interval": str(getattr(coordinator, "update_interval", None)),
+            "polling": coordinator.poll_policy.as_diagnostics() if coordinator else None,
         },
+        "calendar_coordinator": {
+            "last_update_success": getattr(calendar_coordinator, "last_update_success", None),
+            "calendar_last_error": getattr(calendar_coordinator, "calendar_last_error", None),
+            "calendar_last_updated": str(getattr(calendar_coordinator, "calendar_last_updated", None)),
+            "calendar_items": len(getattr(calendar_coordinator, "calendar_items", None) or []),
+            "phase_offset_seconds": getattr(calendar_coordinator, "phase_offset", None),
+            "update_interval": str(getattr(calendar_coordinator, "update_interval", None)),
+        },
+        "client": {
+            "metrics": asdict(runtime.client.metrics) if runtime else None,
+            "circuit_breaker": runtime.client.circuit_breaker.as_dict() if runtime else None,
+        },
+        "scheduler": domain_data["scheduler"].as_dict() if "scheduler" in domain_data else None,
         # optional: ein kleiner Snapshot der letzten Daten (aber nicht zu groß)
         "data_snapshot": _safe_data_snapshot(getattr(coordinator, "data", None)),
     }
@@ -54,7 +78,13 @@ def _safe_data_snapshot(details) -> dict[str, Any] | None:
             "total_work_minutes": getattr(details, "total_work_minutes", None),
             "work_minutes": getattr(details, "work_minutes", None),
             "work_minutes_planed": getattr(details, "work_minutes_planed", None),
-            "work_time": getattr(details, "work_time", None),
+            "work_time": _work_time_snapshot(getattr(details, "work_time", None)),
         }
     except Exception:
         return None
+
+
+def _work_time_snapshot(work_time) -> dict[str, Any] | None:
+    if work_time is None:
+        return None
+    return {"id": work_time.id, "start": work_time.start, "attributes": dict(work_time.attributes)}
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from typing import Any
+
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -28,7 +31,9 @@ class EasyjobBaseEntity:
         username = entry.data.get(CONF_USERNAME, "user")
         base_url = entry.data.get(CONF_BASE_URL, "user")
 
-        coordinator = getattr(self, "coordinator", None)
+        # web_api_version lives on the details coordinator (also for calendar-based entities)
+        runtime = getattr(self, "_runtime", None)
+        coordinator = runtime.coordinator if runtime is not None else getattr(self, "coordinator", None)
         sw_version = getattr(coordinator, "web_api_version", None) if coordinator else None
 
         return DeviceInfo(
@@ -48,3 +53,23 @@ class EasyjobCoordinatorEntity(EasyjobBaseEntity, CoordinatorEntity):
     def __init__(self, coordinator, entry) -> None:
         CoordinatorEntity.__init__(self, coordinator)
         self._entry = entry
+        self._last_written: tuple[Any, ...] | None = None
+
+    def _state_fingerprint(self) -> tuple[Any, ...]:
+        """Everything that ends up in the state machine for this entity."""
+        return (self.available, self.state, self.icon, self.extra_state_attributes)
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        # Also track writes from outside coordinator updates (e.g. optimistic switch/select)
+        self._last_written = self._state_fingerprint()
+        super().async_write_ha_state()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        # Skip the state write if nothing visible changed since the last one
+        fingerprint = self._state_fingerprint()
+        if fingerprint == self._last_written:
+            return
+        self._last_written = fingerprint
+        super().async_write_ha_state()
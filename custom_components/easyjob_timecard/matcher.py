@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import Hashable, Mapping
+
+
+class CaptionMatcher:
+    """Aho-Corasick automaton over normalized status captions.
+
+    `matches(text)` returns the keys of all patterns contained in `text` in a single pass
+    over it, regardless of how many patterns there are. Same semantics as checking
+    `pattern in text` for every pattern (equality included); empty patterns never match.
+    """
+
+    __slots__ = ("_goto", "_fail", "_out")
+
+    def __init__(self, patterns: Mapping[Hashable, str]) -> None:
+        goto: list[dict[str, int]] = [{}]
+        out: list[set[Hashable]] = [set()]
+
+        # Trie of all patterns
+        for key, pattern in patterns.items():
+            if not pattern:
+                continue
+            node = 0
+            for ch in pattern:
+                nxt = goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[node][ch] = nxt
+                    goto.append({})
+                    out.append(set())
+                node = nxt
+            out[node].add(key)
+
+        # Failure links (BFS): longest proper suffix that is also a trie path
+        fail = [0] * len(goto)
+        queue: deque[int] = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in goto[node].items():
+                queue.append(child)
+                state = fail[node]
+                while state and ch not in goto[state]:
+                    state = fail[state]
+                fail[child] = goto[state].get(ch, 0)
+                out[child] |= out[fail[child]]
+
+        self._goto = goto
+        self._fail = fail
+        self._out = [frozenset(keys) for keys in out]
+
+    def matches(self, text: str) -> set[Hashable]:
+        goto, fail, out = self._goto, self._fail, self._out
+        found: set[Hashable] = set()
+        node = 0
+        for ch in text:
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if out[node]:
+                found |= out[node]
+        return found
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Protocol
+
+REASON_ACTIVE = "work_time_active"
+REASON_BOUNDARY = "calendar_boundary"
+REASON_OFF_HOURS = "off_hours"
+REASON_IDLE = "idle"
+
+
+class BoundaryLookup(Protocol):
+    """Sorted resource plan starts/ends (timeline.IntervalIndex)."""
+
+    def next_boundary(self, now: datetime) -> datetime | None: ...
+
+    def has_boundary_within(self, now: datetime, window: timedelta) -> bool: ...
+
+
+@dataclass
+class AdaptivePollPolicy:
+    """Picks the details poll interval from what is going on right now.
+
+    - work time running or a resource plan start/end within `boundary_window`: `min_interval`
+    - off hours (weekend / outside the working day): `max_interval`
+    - otherwise idle: `base_interval`, doubled per unchanged poll, capped at `max_interval`
+    - an upcoming start/end always shortens the interval so the window is not overslept
+    """
+
+    min_interval: float
+    base_interval: float
+    max_interval: float
+    boundary_window: float = 10 * 60
+    workday_start_hour: int = 6
+    workday_end_hour: int = 20
+
+    idle_polls: int = field(default=0, init=False)
+    interval: float = field(default=0.0, init=False)
+    reason: str | None = field(default=None, init=False)
+    # True if `interval` was shortened to wake up when the next boundary window opens;
+    # such an interval must be scheduled as is (no phase alignment that could stretch it)
+    boundary_limited: bool = field(default=False, init=False)
+    # Delay the coordinator actually scheduled (after phase alignment / jitter)
+    scheduled_delay: float | None = field(default=None, init=False)
+
+    def __post_init__(self) -> None:
+        # Tolerate inverted bounds (options saved before the flow checked them) instead of failing
+        self.max_interval = max(self.min_interval, self.max_interval)
+        self.base_interval = min(max(self.base_interval, self.min_interval), self.max_interval)
+        self.interval = self.base_interval
+
+    def is_off_hours(self, now: datetime) -> bool:
+        if now.weekday() >= 5:
+            return True
+        return not (self.workday_start_hour <= now.hour < self.workday_end_hour)
+
+    def next_interval(
+        self,
+        now: datetime,
+        *,
+        active: bool,
+        changed: bool,
+        boundaries: BoundaryLookup | None = None,
+    ) -> float:
+        """Interval (seconds) until the next details poll. `now`: aware, local."""
+        if active or changed:
+            self.idle_polls = 0
+
+        # Seconds to the closest boundary still ahead / whether one is within the window
+        near_boundary = False
+        next_boundary_in: float | None = None
+        if boundaries is not None:
+            near_boundary = boundaries.has_boundary_within(
+                now, timedelta(seconds=self.boundary_window)
+            )
+            next_boundary = boundaries.next_boundary(now)
+            if next_boundary is not None:
+                next_boundary_in = (next_boundary - now).total_seconds()
+
+        if active:
+            interval, reason = self.min_interval, REASON_ACTIVE
+        elif near_boundary:
+            interval, reason = self.min_interval, REASON_BOUNDARY
+        elif self.is_off_hours(now):
+            interval, reason = self.max_interval, REASON_OFF_HOURS
+        else:
+            interval = min(self.max_interval, self.base_interval * 2**self.idle_polls)
+            reason = REASON_IDLE
+            if not changed:
+                self.idle_polls += 1
+
+        # Wake up when the window before the next start/end opens
+        self.boundary_limited = False
+        if next_boundary_in is not None and next_boundary_in - self.boundary_window < interval:
+            interval = max(next_boundary_in - self.boundary_window, self.min_interval)
+            self.boundary_limited = True
+
+        self.interval = max(self.min_interval, min(self.max_interval, interval))
+        self.reason = reason
+        return self.interval
+
+    def as_dict(self) -> dict[str, Any]:
+        """State attributes: only the nominal interval, which holds still between polls."""
+        return {
+            "poll_interval_seconds": round(self.interval),
+            "poll_reason": self.reason,
+        }
+
+    def as_diagnostics(self) -> dict[str, Any]:
+        """as_dict() plus the values that change on (almost) every poll."""
+        return {
+            **self.as_dict(),
+            "poll_scheduled_delay_seconds": self.scheduled_delay,
+            "poll_idle_count": self.idle_polls,
+            "poll_boundary_limited": self.boundary_limited,
+            "poll_min_interval_seconds": self.min_interval,
+            "poll_max_interval_seconds": self.max_interval,
+        }
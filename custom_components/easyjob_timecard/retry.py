@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import random
+
+# Statuses worth another attempt (rate limited / transient server trouble)
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Verbs that may be replayed after the server might already have processed them.
+# POSTs like worktimes/start are NOT in here: replaying them could start/close twice.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Capped exponential backoff with full jitter.
+
+    - attempt n (0-based) sleeps uniform(0, min(max_delay, base_delay * 2**n))
+    - Retry-After from the server wins over the computed backoff
+    - a Retry-After longer than max_retry_after is not waited for (the next poll will retry)
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 8.0
+    max_retry_after: float = 30.0
+
+    def is_retryable(
+        self,
+        method: str,
+        *,
+        status: int | None = None,
+        connect_error: bool = False,
+    ) -> bool:
+        # The request never reached the server / was explicitly rejected: safe for every verb.
+        if connect_error or status == 429:
+            return True
+        if method.upper() not in IDEMPOTENT_METHODS:
+            return False
+        # status None -> timeout / dropped connection on an idempotent request
+        return status is None or status in RETRYABLE_STATUSES
+
+    def backoff(self, attempt: int) -> float:
+        cap = min(self.max_delay, self.base_delay * (2**attempt))
+        return random.uniform(0, cap)
+
+    def delay(self, attempt: int, retry_after: str | None = None) -> float | None:
+        """Seconds to wait before the next attempt, or None to give up."""
+        if attempt + 1 >= self.max_attempts:
+            return None
+        server_delay = parse_retry_after(retry_after)
+        if server_delay is None:
+            return self.backoff(attempt)
+        if server_delay > self.max_retry_after:
+            return None
+        return server_delay
+
+
+class RetryBudget:
+    """Upper bound for retries within one coordinator cycle.
+
+    Keeps a struggling server from being hit with max_attempts x every request of a cycle.
+    Each coordinator owns one and calls `reset()` at the start of its update; requests made
+    outside a coordinator cycle (services, flows) get a fresh budget each.
+    """
+
+    def __init__(self, retries_per_cycle: int = 4) -> None:
+        self.retries_per_cycle = retries_per_cycle
+        self.remaining = retries_per_cycle
+
+    def reset(self) -> None:
+        self.remaining = self.retries_per_cycle
+
+    def try_consume(self) -> bool:
+        if self.remaining <= 0:
+            return False
+        self.remaining -= 1
+        return True
@@ -1,15 +1,20 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from typing import Callable
+
+import aiohttp
 
 from .api import EasyjobClient
-from .coordinator import EasyjobCoordinator
+from .coordinator import EasyjobCalendarCoordinator, EasyjobCoordinator
 
 
 @dataclass
 class RuntimeData:
     client: EasyjobClient
     coordinator: EasyjobCoordinator
+    # Resource plan (calendar + status binary sensors), refreshed independently of details
+    calendar_coordinator: EasyjobCalendarCoordinator
 
     # Cache für ResourceStateTypes (Caption -> IdResourceStateType),
     # damit Services nicht jedes Mal die API abfragen müssen.
@@ -17,3 +22,13 @@ class RuntimeData:
 
     # Merkt sich die Select-Entity-ID auf dem Device (wird von select.py gesetzt)
     resource_state_select_entity_id: str | None = None
+
+
+@dataclass
+class HostSession:
+    """Dedicated aiohttp session for one easyjob server, shared by all entries using it."""
+
+    session: aiohttp.ClientSession
+    entry_ids: set[str] = field(default_factory=set)
+    # Removes the EVENT_HOMEASSISTANT_CLOSE listener that closes the session on shutdown
+    unsub_close: Callable[[], None] | None = None
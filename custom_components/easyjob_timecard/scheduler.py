@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+import time
+from typing import Any, AsyncIterator
+
+
+class _TokenBucket:
+    """Async token bucket: `rate` requests per second, bursts up to `burst`."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        # FIFO: waiters get tokens in arrival order
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+@dataclass
+class HostSchedulerStats:
+    requests: int = 0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    in_flight: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+
+class _HostLane:
+    def __init__(self, rate: float, burst: int, max_concurrency: int) -> None:
+        self.bucket = _TokenBucket(rate, burst)
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.stats = HostSchedulerStats()
+
+
+class RequestScheduler:
+    """Domain-wide request scheduler (one instance in hass.data[DOMAIN]).
+
+    All EasyjobClients route their requests through it, so N config entries against the same
+    easyjob server share one requests-per-second budget and one concurrency limit per host.
+    """
+
+    def __init__(self, rate: float, burst: int, max_concurrency: int) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self._lanes: dict[str, _HostLane] = {}
+
+    def _lane(self, host: str) -> _HostLane:
+        lane = self._lanes.get(host)
+        if lane is None:
+            lane = self._lanes[host] = _HostLane(self.rate, self.burst, self.max_concurrency)
+        return lane
+
+    @asynccontextmanager
+    async def slot(self, host: str, *, hold_concurrency: bool = True) -> AsyncIterator[None]:
+        """Wait for a rate token (and a concurrency slot) for `host`.
+
+        hold_concurrency=False only takes a rate token. Used for /token logins, which can be
+        triggered by requests that already hold a slot (401 refresh) and must not deadlock.
+        """
+        lane = self._lane(host)
+        stats = lane.stats
+        stats.queue_depth += 1
+        stats.max_queue_depth = max(stats.max_queue_depth, stats.queue_depth)
+        started = time.monotonic()
+        acquired = False
+        try:
+            if hold_concurrency:
+                await lane.semaphore.acquire()
+                acquired = True
+            await lane.bucket.acquire()
+        except BaseException:
+            if acquired:
+                lane.semaphore.release()
+            raise
+        finally:
+            stats.queue_depth -= 1
+
+        waited = time.monotonic() - started
+        stats.requests += 1
+        stats.total_wait_seconds += waited
+        stats.max_wait_seconds = max(stats.max_wait_seconds, waited)
+        stats.in_flight += 1
+        try:
+            yield
+        finally:
+            stats.in_flight -= 1
+            if acquired:
+                lane.semaphore.release()
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "rate_per_second": self.rate,
+            "burst": self.burst,
+            "max_concurrency_per_host": self.max_concurrency,
+            "hosts": {host: asdict(lane.stats) for host, lane in self._lanes.items()},
+        }
@@ -1,9 +1,5 @@
 from __future__ import annotations
 
-import ast
-import json
-from typing import Any
-
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -68,37 +64,6 @@ class EasyjobSensor(EasyjobCoordinatorEntity, SensorEntity):
         self._attr_translation_key = key
         self._attr_native_unit_of_measurement = unit
 
-    def _parse_work_time(self, value: Any) -> dict[str, Any] | None:
-        """work_time kann dict sein oder als String ankommen -> robust parsen."""
-        if value is None:
-            return None
-
-        if isinstance(value, dict):
-            return value
-
-        if isinstance(value, str):
-            s = value.strip()
-            if not s:
-                return None
-
-            # 1) echtes JSON
-            try:
-                parsed = json.loads(s)
-                if isinstance(parsed, dict):
-                    return parsed
-            except Exception:
-                pass
-
-            # 2) Python-dict-String wie "{'ID': 1, ...}"
-            try:
-                parsed = ast.literal_eval(s)
-                if isinstance(parsed, dict):
-                    return parsed
-            except Exception:
-                return None
-
-        return None
-
     @property
     def native_value(self):
         data = self.coordinator.data
@@ -111,15 +76,7 @@ class EasyjobSensor(EasyjobCoordinatorEntity, SensorEntity):
 
         # work_time: State soll nur die ID sein (oder unknown via None)
         if self._key == "work_time":
-            wt = self._parse_work_time(value)
-            if not wt:
-                return None
-
-            work_id = wt.get("ID")
-            if isinstance(work_id, (int, float)):
-                return int(work_id)
-            # Wenn ID fehlt/None/komisch -> unknown
-            return None
+            return value.id
 
         # Minuten-Sensoren immer als Ganzzahl
         if isinstance(value, (int, float)):
@@ -138,11 +95,8 @@ class EasyjobSensor(EasyjobCoordinatorEntity, SensorEntity):
             return None
 
         if self._key == "work_time":
-            wt = self._parse_work_time(value)
-            if not wt:
-                return None
             # Alles außer "ID" als Attribute
-            return {k: v for k, v in wt.items() if k != "ID"}
+            return dict(value.attributes)
 
         return None
 
@@ -111,7 +111,7 @@ async def _perform_set_resource_state(
     runtime: RuntimeData = domain_data["entries"][entry_id]
 
     client = runtime.client
-    coordinator = runtime.coordinator
+    calendar_coordinator = runtime.calendar_coordinator
 
     # Select-Entity bevorzugt aus Runtime (wird in select.py gesetzt),
     # fallback: Entity Registry Scan (z.B. direkt nach Migration/Restore)
@@ -175,7 +175,8 @@ async def _perform_set_resource_state(
     except Exception:
         _LOGGER.debug("Konnte persistent notification nicht erstellen.")
 
-    await coordinator.async_request_refresh()
+    # The new resource state shows up in the calendar -> don't wait for its 15 min interval
+    await calendar_coordinator.async_request_refresh()
     return result
 
 
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import asyncio
+import codecs
+from dataclasses import dataclass
+import json
+import time
+from typing import Any, AsyncIterator, Collection, Final
+
+import aiohttp
+
+# The only resource plan fields anything in the integration reads
+CALENDAR_FIELDS: Final = (
+    "Id",
+    "IdT",
+    "Caption",
+    "PreCaption",
+    "PostCaption",
+    "StartDate",
+    "EndDate",
+    "Color",
+)
+
+_CHUNK_SIZE: Final = 64 * 1024
+_WHITESPACE: Final = " \t\r\n"
+# What may follow an array element
+_ELEMENT_END: Final = _WHITESPACE + ",]"
+
+
+@dataclass
+class StreamDecodeStats:
+    bytes: int = 0
+    # Time spent decoding on the event loop (waiting for the body excluded)
+    seconds: float = 0.0
+
+
+@dataclass
+class CalendarDecodeStats(StreamDecodeStats):
+    kept: int = 0
+    dropped: int = 0
+
+
+async def iter_json_array(
+    content: aiohttp.StreamReader, stats: StreamDecodeStats | None = None
+) -> AsyncIterator[Any]:
+    """Yield the elements of a top-level JSON array while the body is still arriving.
+
+    Only the element being decoded (plus one chunk) is buffered, so memory stays bounded by
+    the largest element instead of the whole body. The event loop gets a turn after every
+    chunk, even when the body is already buffered. An empty or null body yields nothing;
+    any other non-array body and anything but whitespace after the array raise.
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    clock = time.perf_counter()
+
+    async def _read(n: int = -1) -> bytes:
+        nonlocal clock
+        if stats is not None:
+            stats.seconds += time.perf_counter() - clock
+        chunk = await content.read(n)
+        # read() does not suspend when the data is already buffered
+        await asyncio.sleep(0)
+        clock = time.perf_counter()
+        if stats is not None:
+            stats.bytes += len(chunk)
+        return chunk
+
+    buf = ""
+    pos = 0
+    started = False
+    # After an element a ',' or ']' must follow; after '[' or ',' an element (or ']' after '[')
+    expect_value = True
+    after_comma = False
+    eof = False
+
+    try:
+        while True:
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+
+            if pos < len(buf):
+                char = buf[pos]
+                if not started:
+                    if char != "[":
+                        rest = buf[pos:] + utf8.decode(await _read(), final=True)
+                        if json.loads(rest) is None:
+                            return
+                        raise json.JSONDecodeError("Expecting '['", rest, 0)
+                    started = True
+                    pos += 1
+                    continue
+
+                if not expect_value:
+                    if char == ",":
+                        pos += 1
+                        expect_value = after_comma = True
+                        continue
+                    if char != "]":
+                        raise json.JSONDecodeError("Expecting ',' delimiter", buf, pos)
+                if char == "]":
+                    if after_comma:
+                        raise json.JSONDecodeError("Expecting value", buf, pos)
+                    rest = buf[pos + 1 :]
+                    if not eof:
+                        rest += utf8.decode(await _read(), final=True)
+                    if rest.strip(_WHITESPACE):
+                        raise json.JSONDecodeError("Extra data", rest, 0)
+                    return
+                if char == ",":
+                    raise json.JSONDecodeError("Expecting value", buf, pos)
+
+                try:
+                    value, end = decoder.raw_decode(buf, pos)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                else:
+                    # A number may be cut off mid-chunk ("1." of "1.5e3" decodes fine): only
+                    # accept an element once its delimiter is in the buffer (or the body ended)
+                    if (end < len(buf) and buf[end] in _ELEMENT_END) or (eof and end == len(buf)):
+                        pos = end
+                        expect_value = after_comma = False
+                        yield value
+                        continue
+                    if eof:
+                        raise json.JSONDecodeError("Expecting ',' delimiter", buf, end)
+            elif eof:
+                if not started:
+                    return
+                raise json.JSONDecodeError("Unterminated array", buf, pos)
+
+            # Need more data: drop what was consumed, append the next chunk
+            chunk = await _read(_CHUNK_SIZE)
+            buf = buf[pos:] + utf8.decode(chunk, final=not chunk)
+            pos = 0
+            eof = not chunk
+    finally:
+        if stats is not None:
+            stats.seconds += time.perf_counter() - clock
+
+
+async def decode_calendar(
+    resp: aiohttp.ClientResponse,
+    deny: Collection[Any],
+    stats: CalendarDecodeStats | None = None,
+) -> list[dict[str, Any]]:
+    """Stream a dashboard/calendar response: keep only CALENDAR_FIELDS, drop denied IdT."""
+    items: list[dict[str, Any]] = []
+    async for item in iter_json_array(resp.content, stats):
+        if not isinstance(item, dict):
+            continue
+        if item.get("IdT") in deny:
+            if stats is not None:
+                stats.dropped += 1
+            continue
+        items.append({key: item[key] for key in CALENDAR_FIELDS if key in item})
+        if stats is not None:
+            stats.kept += 1
+    return items
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Iterable, Iterator, Mapping
+
+from .matcher import CaptionMatcher
+from .util import parse_datetime
+
+
+def _int_or_none(value: Any) -> int | None:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class ResourcePlanItem:
+    """One resource plan entry, parsed once per calendar refresh (only the fields we use)."""
+
+    id: Any
+    id_t: int | None
+    caption: str
+    caption_norm: str  # strip + casefold, for status matching
+    color: str | None
+    start: datetime  # aware (UTC)
+    end: datetime  # aware (UTC)
+    pre_caption: str | None = None
+    post_caption: str | None = None
+
+    @classmethod
+    def from_api(cls, item: Mapping[str, Any]) -> ResourcePlanItem | None:
+        """Build from a raw dashboard/calendar item; None if start/end can't be parsed."""
+        start = parse_datetime(item.get("StartDate"))
+        end = parse_datetime(item.get("EndDate"))
+        if start is None or end is None:
+            return None
+        caption = str(item.get("Caption") or "")
+        return cls(
+            id=item.get("Id"),
+            id_t=_int_or_none(item.get("IdT")),
+            caption=caption,
+            caption_norm=caption.strip().casefold(),
+            color=item.get("Color") or None,
+            start=start,
+            end=end,
+            pre_caption=item.get("PreCaption") or None,
+            post_caption=item.get("PostCaption") or None,
+        )
+
+
+class IntervalIndex:
+    """Immutable interval index over resource plan items.
+
+    Items are sorted by start; `_max_ends[i]` is the latest end among entries 0..i
+    (non-decreasing), so everything that ended before a given instant is skipped with a
+    bisect instead of a scan. Queries are O(log n + k).
+
+    Built once per calendar refresh by the calendar coordinator; entities only query it.
+    """
+
+    __slots__ = ("_starts", "_ends", "_max_ends", "_items", "_boundaries")
+
+    def __init__(self, items: Iterable[ResourcePlanItem] = ()) -> None:
+        ordered = sorted(items, key=lambda it: it.start)
+        max_ends: list[datetime] = []
+        latest: datetime | None = None
+        for it in ordered:
+            if latest is None or it.end > latest:
+                latest = it.end
+            max_ends.append(latest)
+
+        self._items: tuple[ResourcePlanItem, ...] = tuple(ordered)
+        self._starts: tuple[datetime, ...] = tuple(it.start for it in ordered)
+        self._ends: tuple[datetime, ...] = tuple(it.end for it in ordered)
+        self._max_ends: tuple[datetime, ...] = tuple(max_ends)
+        self._boundaries: tuple[datetime, ...] = tuple(sorted(self._starts + self._ends))
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def boundaries(self) -> tuple[datetime, ...]:
+        """All starts and ends, sorted."""
+        return self._boundaries
+
+    def next_boundary(self, now: datetime) -> datetime | None:
+        """First start/end strictly after now (O(log n))."""
+        i = bisect_right(self._boundaries, now)
+        return self._boundaries[i] if i < len(self._boundaries) else None
+
+    def has_boundary_within(self, now: datetime, window: timedelta) -> bool:
+        """Whether any start/end lies in [now - window, now + window] (O(log n))."""
+        i = bisect_left(self._boundaries, now - window)
+        return i < len(self._boundaries) and self._boundaries[i] <= now + window
+
+    def iter_not_ended(self, now: datetime) -> Iterator[ResourcePlanItem]:
+        """Items with end > now, in start order (first one: current or next event)."""
+        for i in range(bisect_right(self._max_ends, now), len(self._items)):
+            if self._ends[i] > now:
+                yield self._items[i]
+
+    def overlapping(self, start: datetime, end: datetime) -> list[ResourcePlanItem]:
+        """Items overlapping [start, end] (bounds inclusive), in start order."""
+        lo = bisect_left(self._max_ends, start)
+        hi = bisect_right(self._starts, end)
+        return [self._items[i] for i in range(lo, hi) if self._ends[i] >= start]
+
+
+@dataclass(frozen=True, slots=True)
+class StatusSnapshot:
+    """Resource status at one instant; valid until `next_change`."""
+
+    active: ResourcePlanItem | None
+    next: ResourcePlanItem | None
+    next_change: datetime | None
+    matching_count: int
+
+
+class StatusTimeline:
+    """Items matching one resource status, sorted by start, with a memoized snapshot.
+
+    The snapshot is recomputed only when `now` leaves [computed_at, next_change), so
+    repeated evaluations between two boundaries are O(1).
+    """
+
+    __slots__ = ("_items", "_snapshot", "_valid_from", "_valid_until")
+
+    def __init__(self, items: Iterable[ResourcePlanItem]) -> None:
+        self._items: tuple[ResourcePlanItem, ...] = tuple(sorted(items, key=lambda it: it.start))
+        self._snapshot: StatusSnapshot | None = None
+        self._valid_from: datetime | None = None
+        self._valid_until: datetime | None = None
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def at(self, now: datetime) -> StatusSnapshot:
+        snapshot = self._snapshot
+        if (
+            snapshot is not None
+            and self._valid_from <= now
+            and (self._valid_until is None or now < self._valid_until)
+        ):
+            return snapshot
+
+        active: ResourcePlanItem | None = None
+        upcoming: ResourcePlanItem | None = None
+        next_change: datetime | None = None
+        for it in self._items:
+            if it.start <= now < it.end:
+                if active is None:
+                    active = it
+            elif it.start >= now and upcoming is None:
+                upcoming = it
+
+            for boundary in (it.start, it.end):
+                if boundary > now and (next_change is None or boundary < next_change):
+                    next_change = boundary
+
+        snapshot = StatusSnapshot(active, upcoming, next_change, len(self._items))
+        self._snapshot, self._valid_from, self._valid_until = snapshot, now, next_change
+        return snapshot
+
+
+def build_status_timelines(
+    items: Iterable[ResourcePlanItem],
+    statuses: Mapping[int, str],
+) -> dict[int, StatusTimeline]:
+    """Items per status: IdResourceStateType == status_id, or caption contains the status caption.
+
+    All status captions are compiled into one matcher, so every item is classified against
+    every status in a single pass over its caption.
+    """
+    matcher = CaptionMatcher(statuses)
+    matched: dict[int, list[ResourcePlanItem]] = {status_id: [] for status_id in statuses}
+    for it in items:
+        hits = matcher.matches(it.caption_norm) if it.caption_norm else set()
+        if it.id_t in matched:
+            hits.add(it.id_t)
+        for status_id in hits:
+            matched[status_id].append(it)
+    return {status_id: StatusTimeline(found) for status_id, found in matched.items()}
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, tzinfo
+from functools import lru_cache
 from typing import Any
 
 from homeassistant.util import dt as dt_util
@@ -48,14 +49,34 @@ def parse_datetime(value: str | datetime | None) -> datetime | None:
         return None
 
     if isinstance(value, datetime):
-        dt = value
-    else:
-        dt = dt_util.parse_datetime(value)
+        # HA: naive wird in der HA-Zeitzone interpretiert, aware wird nach UTC konvertiert
+        return dt_util.as_utc(value)
+
+    return _parse_datetime_str(value, dt_util.DEFAULT_TIME_ZONE)
+
+
+# Resource plan timestamps repeat across refreshes -> memoize (result is immutable).
+# Naive values are local to the HA time zone, so the zone is part of the key: after the
+# user changes it, old entries are simply no longer hit.
+@lru_cache(maxsize=4096)
+def _parse_datetime_str(value: str, time_zone: tzinfo) -> datetime | None:
+    dt: datetime | None = None
+
+    # Fast path for easyjob's fixed YYYY-MM-DDTHH:MM:SS[.fff][offset]; date-only strings and
+    # anything else go through HA's generic parser (keeps its semantics)
+    if len(value) >= 19 and value[10] in "T ":
+        try:
+            dt = datetime.fromisoformat(value)
+        except ValueError:
+            dt = None
 
     if dt is None:
-        return None
+        dt = dt_util.parse_datetime(value)
+        if dt is None:
+            return None
 
-    # HA: naive wird als UTC interpretiert, aware wird nach UTC konvertiert
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=time_zone)
     return dt_util.as_utc(dt)
 
 
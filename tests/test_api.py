@@ -0,0 +1,430 @@
+"""EasyjobClient request pipeline against a local aiohttp test server."""
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable
+
+from aiohttp import ClientSession, web
+from aiohttp.test_utils import TestServer
+import pytest
+
+from custom_components.easyjob_timecard.api import (
+    EasyjobCircuitOpenError,
+    EasyjobClient,
+    EasyjobRequestError,
+)
+from custom_components.easyjob_timecard.circuit_breaker import (
+    STATE_CLOSED,
+    STATE_OPEN,
+    CircuitBreaker,
+)
+from custom_components.easyjob_timecard.retry import RetryBudget, RetryPolicy
+from custom_components.easyjob_timecard.scheduler import RequestScheduler
+
+Handler = Callable[[web.Request], Awaitable[web.StreamResponse]]
+
+
+class _Server:
+    """Counts requests per path; /token hands out t1, t2, ... (slowly, to let callers pile up)."""
+
+    def __init__(self) -> None:
+        self.calls: Counter[str] = Counter()
+        self.routes: dict[tuple[str, str], Handler] = {}
+        self.route("POST", "/token", self._token)
+
+    def route(self, method: str, path: str, handler: Handler) -> None:
+        self.routes[(method, path)] = handler
+
+    async def _token(self, request: web.Request) -> web.Response:
+        await asyncio.sleep(0.05)
+        return web.json_response({"access_token": f"t{self.calls['/token']}", "expires_in": 600})
+
+    async def _dispatch(self, request: web.Request) -> web.StreamResponse:
+        self.calls[request.path] += 1
+        handler = self.routes.get((request.method, request.path))
+        if handler is None:
+            raise web.HTTPNotFound()
+        return await handler(request)
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", self._dispatch)
+        return app
+
+
+def _run(
+    server: _Server,
+    scenario: Callable[[EasyjobClient], Awaitable[Any]],
+    **client_kwargs: Any,
+) -> Any:
+    async def main() -> Any:
+        test_server = TestServer(server.app())
+        await test_server.start_server()
+        try:
+            async with ClientSession() as session:
+                client = EasyjobClient(
+                    session, str(test_server.make_url("")), "user", "secret", **client_kwargs
+                )
+                try:
+                    return await scenario(client)
+                finally:
+                    await client.async_shutdown()
+        finally:
+            await test_server.close()
+
+    return asyncio.run(main())
+
+
+def _json(payload: Any, delay: float = 0.0, **kwargs: Any) -> Handler:
+    async def handler(request: web.Request) -> web.Response:
+        if delay:
+            await asyncio.sleep(delay)
+        return web.json_response(payload, **kwargs)
+
+    return handler
+
+
+def test_concurrent_callers_share_one_login() -> None:
+    server = _Server()
+
+    async def scenario(client: EasyjobClient) -> list[str]:
+        return await asyncio.gather(*(client.async_get_token() for _ in range(5)))
+
+    tokens = _run(server, scenario)
+    assert tokens == ["t1"] * 5
+    assert server.calls["/token"] == 1
+
+
+def test_concurrent_401s_share_one_relogin() -> None:
+    server = _Server()
+
+    async def protected(request: web.Request) -> web.Response:
+        if request.headers["Authorization"] != "Bearer t2":
+            raise web.HTTPUnauthorized()
+        return web.json_response({"path": request.path})
+
+    for path in ("/api/a", "/api/b", "/api/c"):
+        server.route("GET", path, protected)
+
+    async def scenario(client: EasyjobClient) -> list[Any]:
+        await client.async_get_token()
+        return await asyncio.gather(
+            *(client._request("GET", path) for path in ("/api/a", "/api/b", "/api/c"))
+        )
+
+    results = _run(server, scenario)
+    assert [r["path"] for r in results] == ["/api/a", "/api/b", "/api/c"]
+    # Initial login + one shared refresh for all three 401s
+    assert server.calls["/token"] == 2
+
+
+def test_concurrent_identical_gets_are_coalesced() -> None:
+    server = _Server()
+    server.route("GET", "/api/data", _json({"value": 1}, delay=0.05))
+
+    async def scenario(client: EasyjobClient) -> tuple[list[Any], int]:
+        results = await asyncio.gather(*(client._request("GET", "/api/data") for _ in range(5)))
+        return results, client.metrics.coalesced_requests
+
+    results, coalesced = _run(server, scenario)
+    assert results == [{"value": 1}] * 5
+    assert server.calls["/api/data"] == 1
+    assert coalesced == 4
+
+
+def test_cancelled_caller_does_not_cancel_shared_get() -> None:
+    server = _Server()
+    server.route("GET", "/api/data", _json({"value": 1}, delay=0.1))
+
+    async def scenario(client: EasyjobClient) -> Any:
+        first = asyncio.ensure_future(client._request("GET", "/api/data"))
+        second = asyncio.ensure_future(client._request("GET", "/api/data"))
+        await asyncio.sleep(0.08)
+        first.cancel()
+        return await second
+
+    assert _run(server, scenario) == {"value": 1}
+    assert server.calls["/api/data"] == 1
+
+
+def test_fresh_cache_entry_skips_the_server() -> None:
+    server = _Server()
+    server.route("GET", "/api/settings", _json({"value": 1}))
+
+    async def scenario(client: EasyjobClient) -> tuple[Any, Any, int]:
+        first = await client._request("GET", "/api/settings")
+        second = await client._request("GET", "/api/settings")
+        return first, second, client.metrics.cache_hits
+
+    first, second, hits = _run(server, scenario, cache_ttls={"/api/settings": 60})
+    assert first == second == {"value": 1}
+    assert server.calls["/api/settings"] == 1
+    assert hits == 1
+
+
+def test_stale_entry_is_revalidated_with_etag() -> None:
+    server = _Server()
+    seen: list[str | None] = []
+
+    async def etagged(request: web.Request) -> web.Response:
+        seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304)
+        return web.json_response({"value": 1}, headers={"ETag": '"v1"'})
+
+    server.route("GET", "/api/data", etagged)
+
+    async def scenario(client: EasyjobClient) -> tuple[Any, Any, int]:
+        first = await client._request("GET", "/api/data")
+        second = await client._request("GET", "/api/data")
+        return first, second, client.metrics.cache_revalidated
+
+    first, second, revalidated = _run(server, scenario, cache_ttls={})
+    assert first == second == {"value": 1}
+    assert seen == [None, '"v1"']
+    assert revalidated == 1
+
+
+def test_write_invalidates_the_cache() -> None:
+    server = _Server()
+    server.route("GET", "/api/settings", _json({"value": 1}))
+    server.route("POST", "/api/start", _json({}))
+
+    async def scenario(client: EasyjobClient) -> None:
+        await client._request("GET", "/api/settings")
+        await client._request("POST", "/api/start", json={})
+        await client._request("GET", "/api/settings")
+
+    _run(server, scenario, cache_ttls={"/api/settings": 60})
+    assert server.calls["/api/settings"] == 2
+
+
+def _flaky(failures: list[web.Response], payload: Any) -> Handler:
+    """Answer with `failures` in turn, then with `payload`."""
+
+    async def handler(request: web.Request) -> web.Response:
+        if failures:
+            return failures.pop(0)
+        return web.json_response(payload)
+
+    return handler
+
+
+def test_503_is_retried_after_retry_after() -> None:
+    server = _Server()
+    server.route(
+        "GET",
+        "/api/data",
+        _flaky([web.Response(status=503, headers={"Retry-After": "0.1"})], {"value": 1}),
+    )
+
+    async def scenario(client: EasyjobClient) -> tuple[Any, float, int]:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        result = await client._request("GET", "/api/data")
+        return result, loop.time() - started, client.metrics.retries
+
+    result, elapsed, retries = _run(server, scenario)
+    assert result == {"value": 1}
+    assert server.calls["/api/data"] == 2
+    assert retries == 1
+    assert elapsed >= 0.1
+
+
+def test_long_retry_after_is_not_waited_for() -> None:
+    server = _Server()
+    server.route(
+        "GET",
+        "/api/data",
+        _flaky([web.Response(status=503, headers={"Retry-After": "3600"})], {"value": 1}),
+    )
+
+    async def scenario(client: EasyjobClient) -> None:
+        with pytest.raises(EasyjobRequestError):
+            await client._request("GET", "/api/data")
+
+    _run(server, scenario)
+    assert server.calls["/api/data"] == 1
+
+
+def _slow(delay: float) -> Handler:
+    async def handler(request: web.Request) -> web.Response:
+        await asyncio.sleep(delay)
+        return web.json_response({})
+
+    return handler
+
+
+def test_post_is_not_replayed_after_read_timeout() -> None:
+    server = _Server()
+    server.route("POST", "/api/start", _slow(0.3))
+
+    async def scenario(client: EasyjobClient) -> None:
+        await client.async_get_token()
+        with pytest.raises(EasyjobRequestError):
+            await client._request("POST", "/api/start", json={})
+
+    _run(server, scenario, read_timeout=0.1, retry_policy=RetryPolicy(base_delay=0.01))
+    assert server.calls["/api/start"] == 1
+
+
+def test_get_is_retried_after_read_timeout() -> None:
+    server = _Server()
+    server.route("GET", "/api/data", _slow(0.3))
+
+    async def scenario(client: EasyjobClient) -> None:
+        await client.async_get_token()
+        with pytest.raises(EasyjobRequestError):
+            await client._request("GET", "/api/data")
+
+    _run(server, scenario, read_timeout=0.1, retry_policy=RetryPolicy(base_delay=0.01))
+    assert server.calls["/api/data"] == 3
+
+
+def test_breaker_opens_and_backs_off_on_an_unreachable_server() -> None:
+    async def main() -> None:
+        # Bind and release a port so connections to it are refused
+        dead = TestServer(web.Application())
+        await dead.start_server()
+        base_url = str(dead.make_url(""))
+        await dead.close()
+
+        breaker = CircuitBreaker(probe_interval=0.05)
+        async with ClientSession() as session:
+            client = EasyjobClient(
+                session,
+                base_url,
+                "user",
+                "secret",
+                retry_policy=RetryPolicy(base_delay=0.01),
+                circuit_breaker=breaker,
+            )
+            client._access_token = "t1"
+            client._token_expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+
+            # One request with all its retries stays below the threshold ...
+            with pytest.raises(EasyjobRequestError):
+                await client._request("GET", "/api/a")
+            assert breaker.state == STATE_CLOSED
+            assert breaker.consecutive_failures == RetryPolicy().max_attempts
+
+            # ... a second failing request opens the circuit
+            with pytest.raises(EasyjobRequestError):
+                await client._request("GET", "/api/b")
+            assert breaker.state == STATE_OPEN
+
+            rejections = client.metrics.circuit_rejections
+            with pytest.raises(EasyjobCircuitOpenError):
+                await client._request("GET", "/api/c")
+            assert client.metrics.circuit_rejections == rejections + 1
+
+            # Failed half-open probe: open again with a doubled interval
+            await asyncio.sleep(0.06)
+            with pytest.raises(EasyjobRequestError):
+                await client._request("GET", "/api/d")
+            assert breaker.state == STATE_OPEN
+            assert breaker.probe_interval == pytest.approx(0.1)
+
+    asyncio.run(main())
+
+
+def test_successful_probe_closes_the_breaker() -> None:
+    server = _Server()
+    server.route("GET", "/api/data", _json({"value": 1}))
+    breaker = CircuitBreaker(failure_threshold=1, probe_interval=0.05)
+    breaker.record_failure()
+
+    async def scenario(client: EasyjobClient) -> Any:
+        with pytest.raises(EasyjobCircuitOpenError):
+            await client._request("GET", "/api/data")
+        await asyncio.sleep(0.06)
+        return await client._request("GET", "/api/data")
+
+    assert _run(server, scenario, circuit_breaker=breaker) == {"value": 1}
+    assert breaker.state == STATE_CLOSED
+    assert breaker.probe_interval == 0.05
+
+
+def test_scheduler_caps_concurrent_requests_per_host() -> None:
+    server = _Server()
+    active = 0
+    peak = 0
+
+    async def tracked(request: web.Request) -> web.Response:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.05)
+        active -= 1
+        return web.json_response({"path": request.path})
+
+    paths = [f"/api/{n}" for n in range(6)]
+    for path in paths:
+        server.route("GET", path, tracked)
+    scheduler = RequestScheduler(rate=1000, burst=100, max_concurrency=2)
+
+    async def scenario(client: EasyjobClient) -> list[Any]:
+        return await asyncio.gather(*(client._request("GET", path) for path in paths))
+
+    results = _run(server, scenario, scheduler=scheduler)
+    assert [r["path"] for r in results] == paths
+    assert peak == 2
+    stats = next(iter(scheduler.as_dict()["hosts"].values()))
+    # The login only takes a rate token, without holding a concurrency slot
+    assert stats["requests"] == len(paths) + 1
+    assert stats["in_flight"] == 0
+    assert stats["max_queue_depth"] >= len(paths) - 2
+
+
+def test_service_calls_keep_retrying_after_earlier_failures() -> None:
+    server = _Server()
+    failures: list[web.Response] = []
+    server.route("POST", "/api.json/ResourceStates/Save", _flaky(failures, {"ok": True}))
+
+    async def scenario(client: EasyjobClient) -> list[Any]:
+        client._idaddress = 1
+        results = []
+        # More retries in total than one budget holds: each call must get its own
+        for _ in range(4):
+            failures.extend(
+                web.Response(status=429, headers={"Retry-After": "0"}) for _ in range(2)
+            )
+            results.append(await client.async_save_resource_state(1, "start", "end"))
+        return results
+
+    assert _run(server, scenario) == [{"ok": True}] * 4
+    assert server.calls["/api.json/ResourceStates/Save"] == 12
+
+
+def test_cycle_budget_caps_retries_across_requests() -> None:
+    server = _Server()
+    failures = [web.Response(status=503, headers={"Retry-After": "0"}) for _ in range(2)]
+    server.route("GET", "/api/data", _flaky(failures, {"value": 1}))
+
+    async def scenario(client: EasyjobClient) -> int:
+        with client.retry_cycle(RetryBudget(retries_per_cycle=1)):
+            with pytest.raises(EasyjobRequestError):
+                await client._request("GET", "/api/data")
+        return client.metrics.retry_budget_exhausted
+
+    assert _run(server, scenario) == 1
+    assert server.calls["/api/data"] == 2
+
+
+def test_malformed_calendar_body_raises_request_error() -> None:
+    server = _Server()
+
+    async def truncated(request: web.Request) -> web.Response:
+        body = b'[{"Id": 1, "Caption": "x"}, {"Id": 2'
+        return web.Response(body=body, content_type="application/json")
+
+    server.route("GET", "/api.json/dashboard/calendar/", truncated)
+
+    async def scenario(client: EasyjobClient) -> None:
+        with pytest.raises(EasyjobRequestError) as exc_info:
+            await client.async_fetch_calendar(date(2024, 1, 1), date(2024, 1, 8))
+        assert isinstance(exc_info.value.__cause__, ValueError)
+
+    _run(server, scenario)
@@ -0,0 +1,102 @@
+"""CaptionMatcher / build_status_timelines against the previous per-sensor matching rule."""
+from __future__ import annotations
+
+import random
+from typing import Any
+
+import pytest
+
+from custom_components.easyjob_timecard.matcher import CaptionMatcher
+from custom_components.easyjob_timecard.timeline import ResourcePlanItem, build_status_timelines
+
+
+def _norm_text(v: Any) -> str:
+    return str(v).strip().casefold() if v is not None else ""
+
+
+def _event_matches_status(it: dict[str, Any], status_id: int, status_caption_norm: str) -> bool:
+    """Reference: the rule each status binary sensor applied before the shared matcher."""
+    try:
+        if int(it.get("IdT")) == status_id:
+            return True
+    except Exception:
+        pass
+
+    if not status_caption_norm:
+        return False
+
+    ev_cap_norm = _norm_text(it.get("Caption"))
+    if not ev_cap_norm:
+        return False
+
+    return ev_cap_norm == status_caption_norm or status_caption_norm in ev_cap_norm
+
+
+# Small alphabet -> lots of overlapping / nested / repeated patterns
+_ALPHABET = "aab ßSsİ-"
+
+
+def _text(rnd: random.Random, max_len: int) -> str:
+    return "".join(rnd.choice(_ALPHABET) for _ in range(rnd.randrange(max_len + 1)))
+
+
+def _item(rnd: random.Random, i: int, status_ids: list[int]) -> dict[str, Any]:
+    return {
+        "Id": i,
+        "IdT": rnd.choice([None, "x", str(rnd.choice(status_ids)), rnd.choice(status_ids), 999]),
+        "Caption": rnd.choice([None, "", "  ", _text(rnd, 12)]),
+        "StartDate": "2026-03-02T08:00:00",
+        "EndDate": "2026-03-02T17:00:00",
+    }
+
+
+@pytest.mark.parametrize(
+    ("patterns", "text", "expected"),
+    [
+        ({1: "urlaub"}, "urlaub", {1}),  # equality
+        ({1: "urlaub"}, "halber urlaub", {1}),  # substring
+        ({1: "urlaub"}, "urlau", set()),
+        ({1: ""}, "urlaub", set()),  # empty patterns never match
+        ({1: "a"}, "", set()),
+        ({1: "he", 2: "she", 3: "his", 4: "hers"}, "ushers", {1, 2, 4}),  # classic overlaps
+        ({1: "aa", 2: "aaa", 3: "a"}, "aa", {1, 3}),  # nested
+        ({1: "ab", 2: "ab"}, "xaby", {1, 2}),  # same caption for two statuses
+        ({1: "abab"}, "abaabab", {1}),  # needs the failure link
+        ({1: "mobile office", 2: "office"}, "mobile office", {1, 2}),
+    ],
+)
+def test_matches_examples(patterns: dict[int, str], text: str, expected: set[int]) -> None:
+    assert CaptionMatcher(patterns).matches(text) == expected
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_matches_equals_substring_rule(seed: int) -> None:
+    rnd = random.Random(seed)
+    patterns = {i: _text(rnd, 4) for i in range(rnd.randrange(1, 8))}
+    matcher = CaptionMatcher(patterns)
+    for _ in range(100):
+        text = _text(rnd, 20)
+        expected = {key for key, pattern in patterns.items() if pattern and pattern in text}
+        assert matcher.matches(text) == expected
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_build_status_timelines_equals_old_rule(seed: int) -> None:
+    rnd = random.Random(seed)
+    status_ids = rnd.sample(range(1, 20), rnd.randrange(1, 6))
+    # Captions are normalized like the status sensors do (strip + casefold)
+    statuses = {status_id: _norm_text(_text(rnd, 4)) for status_id in status_ids}
+    raw_items = [_item(rnd, i, status_ids) for i in range(60)]
+    items = [ResourcePlanItem.from_api(raw) for raw in raw_items]
+
+    timelines = build_status_timelines(items, statuses)
+
+    assert set(timelines) == set(statuses)
+    for status_id, caption_norm in statuses.items():
+        expected = [
+            raw["Id"]
+            for raw in raw_items
+            if _event_matches_status(raw, status_id, caption_norm)
+        ]
+        found = [it.id for it in timelines[status_id]._items]
+        assert sorted(found) == sorted(expected)
@@ -0,0 +1,111 @@
+"""iter_json_array on bodies that arrive in arbitrary chunks."""
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+from typing import Any
+
+import pytest
+
+from custom_components.easyjob_timecard.stream_decode import StreamDecodeStats, iter_json_array
+
+
+class _ChunkedReader:
+    """Minimal aiohttp.StreamReader stand-in returning pieces of random size."""
+
+    def __init__(self, body: bytes, rnd: random.Random, max_chunk: int) -> None:
+        self._body = body
+        self._rnd = rnd
+        self._max_chunk = max_chunk
+
+    async def read(self, n: int = -1) -> bytes:
+        size = len(self._body) if n < 0 else min(n, self._rnd.randint(1, self._max_chunk))
+        chunk, self._body = self._body[:size], self._body[size:]
+        return chunk
+
+
+def _decode(body: str, seed: int = 0, max_chunk: int = 3) -> list[Any]:
+    async def collect() -> list[Any]:
+        reader = _ChunkedReader(body.encode("utf-8"), random.Random(seed), max_chunk)
+        return [value async for value in iter_json_array(reader)]
+
+    return asyncio.run(collect())
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        "[1.5e3 ]",
+        "[1.5e3]",
+        "[-0.25E-2, 10, 1e+2,3]",
+        '[12345678901234567890, "a,b]", true, false, null]',
+        '[ {"Id": 1, "Caption": "Ürlaub ✓"} , [1, [2]], {} ]',
+        "[]",
+        " [ ] ",
+    ],
+)
+@pytest.mark.parametrize("seed", range(10))
+def test_split_anywhere(body: str, seed: int) -> None:
+    assert _decode(body, seed, max_chunk=1 + seed % 4) == json.loads(body)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_random_arrays(seed: int) -> None:
+    rnd = random.Random(seed)
+    values = [
+        rnd.choice(
+            [
+                rnd.uniform(-1e6, 1e6),
+                rnd.randint(-(10**12), 10**12),
+                {"Id": rnd.randint(0, 99), "Caption": "x" * rnd.randint(0, 5)},
+                "s" * rnd.randint(0, 5),
+                None,
+            ]
+        )
+        for _ in range(200)
+    ]
+    body = json.dumps(values, indent=rnd.choice([None, 1]))
+    assert _decode(body, seed, max_chunk=17) == values
+
+
+def test_stats_count_the_whole_body() -> None:
+    body = '[{"Id": 1}, "ü", 2.5]  \n'
+    stats = StreamDecodeStats()
+
+    async def collect() -> list[Any]:
+        reader = _ChunkedReader(body.encode("utf-8"), random.Random(0), 3)
+        return [value async for value in iter_json_array(reader, stats)]
+
+    assert asyncio.run(collect()) == json.loads(body)
+    assert stats.bytes == len(body.encode("utf-8"))
+    assert stats.seconds > 0
+
+
+@pytest.mark.parametrize("body", ["null", "", " \n"])
+def test_empty_body_yields_nothing(body: str) -> None:
+    assert _decode(body) == []
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        "[1, 2",
+        "[1.5x]",
+        '[{"a": 1}',
+        "garbage",
+        "[1 2]",
+        "[1,,2]",
+        "[,1]",
+        "[1,]",
+        "[,]",
+        "[1]]",
+        "[1] x",
+        '{"a": 1}',
+        "1",
+    ],
+)
+@pytest.mark.parametrize("seed", range(3))
+def test_invalid_json_raises(body: str, seed: int) -> None:
+    with pytest.raises(json.JSONDecodeError):
+        _decode(body, seed, max_chunk=1 + seed)
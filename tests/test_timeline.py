@@ -0,0 +1,59 @@
+"""IntervalIndex against brute-force scans over random resource plans."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+import random
+
+import pytest
+
+from custom_components.easyjob_timecard.timeline import IntervalIndex, ResourcePlanItem
+
+ORIGIN = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _items(rnd: random.Random, n: int) -> list[ResourcePlanItem]:
+    items = []
+    for i in range(n):
+        start = ORIGIN + timedelta(minutes=rnd.randrange(0, 60 * 24 * 60, 15))
+        end = start + timedelta(minutes=rnd.randrange(0, 5 * 24 * 60, 15))
+        items.append(ResourcePlanItem(i, None, "", "", None, start, end))
+    return items
+
+
+def _instant(rnd: random.Random) -> datetime:
+    # On the 15 min grid half of the time, so boundaries are hit exactly
+    step = 15 if rnd.random() < 0.5 else 1
+    return ORIGIN + timedelta(minutes=rnd.randrange(-24 * 60, 66 * 24 * 60, step))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_queries_match_brute_force(seed: int) -> None:
+    rnd = random.Random(seed)
+    items = _items(rnd, rnd.randrange(0, 300))
+    index = IntervalIndex(items)
+    by_start = sorted(items, key=lambda it: it.start)
+    boundaries = sorted(b for it in items for b in (it.start, it.end))
+
+    for _ in range(50):
+        now = _instant(rnd)
+        other = _instant(rnd)
+        start, end = min(now, other), max(now, other)
+        window = timedelta(minutes=rnd.choice((0, 10, 60)))
+
+        assert list(index.iter_not_ended(now)) == [it for it in by_start if it.end > now]
+        assert index.overlapping(start, end) == [
+            it for it in by_start if it.end >= start and it.start <= end
+        ]
+        assert index.next_boundary(now) == next((b for b in boundaries if b > now), None)
+        assert index.has_boundary_within(now, window) == any(
+            abs(b - now) <= window for b in boundaries
+        )
+
+
+def test_empty_index() -> None:
+    index = IntervalIndex()
+    assert len(index) == 0
+    assert index.boundaries() == ()
+    assert index.next_boundary(ORIGIN) is None
+    assert not index.has_boundary_within(ORIGIN, timedelta(hours=1))
+    assert index.overlapping(ORIGIN, ORIGIN + timedelta(days=1)) == []
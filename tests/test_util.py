@@ -0,0 +1,60 @@
+"""util.parse_datetime: fast path + cache against Home Assistant's generic parser."""
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import datetime, timezone
+
+import pytest
+from homeassistant.util import dt as dt_util
+
+from custom_components.easyjob_timecard.util import parse_datetime
+
+
+@pytest.fixture(autouse=True)
+def _restore_time_zone() -> Iterator[None]:
+    original = dt_util.DEFAULT_TIME_ZONE
+    yield
+    dt_util.set_default_time_zone(original)
+
+
+def _generic(value: str) -> datetime | None:
+    dt = dt_util.parse_datetime(value)
+    return None if dt is None else dt_util.as_utc(dt)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2026-03-02T08:00:00",
+        "2026-03-02T08:00:00.123",
+        "2026-03-02 08:00:00",
+        "2026-03-02T08:00:00Z",
+        "2026-03-02T08:00:00+01:00",
+        "2026-03-02T08:00:00.5-05:30",
+        "2026-03-29T02:30:00",  # skipped by the DST switch in Europe/Berlin
+        "2026-03-02",
+        "not a date",
+        "",
+    ],
+)
+@pytest.mark.parametrize("zone", ["UTC", "Europe/Berlin", "America/New_York"])
+def test_matches_generic_parser(value: str, zone: str) -> None:
+    dt_util.set_default_time_zone(dt_util.get_time_zone(zone))
+    assert parse_datetime(value) == _generic(value)
+
+
+def test_naive_values_follow_time_zone_changes() -> None:
+    value = "2026-07-01T12:00:00"
+
+    dt_util.set_default_time_zone(dt_util.get_time_zone("Europe/Berlin"))
+    assert parse_datetime(value) == datetime(2026, 7, 1, 10, 0, tzinfo=timezone.utc)
+
+    # Same string, cached before: must not keep the old offset
+    dt_util.set_default_time_zone(dt_util.get_time_zone("America/New_York"))
+    assert parse_datetime(value) == datetime(2026, 7, 1, 16, 0, tzinfo=timezone.utc)
+
+
+def test_datetime_and_none() -> None:
+    aware = datetime(2026, 7, 1, 12, 0, tzinfo=timezone.utc)
+    assert parse_datetime(aware) == aware
+    assert parse_datetime(None) is None